@@ -0,0 +1,745 @@
+# Benchmarks
+# Standalone performance measurements for the linked list classes.
+# Run all benchmarks with `python benchmarks.py` or pick some by name,
+# e.g. `python benchmarks.py construction`.
+
+import copy
+import functools
+import gc
+import heapq
+import io
+import pickle
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from linked_list_classes import (
+    SinglyLinkedList, DoublyLinkedList, CircularLinkedList, ArenaLinkedList,
+    IndexedSinglyLinkedList, IndexedDoublyLinkedList, IndexedCircularLinkedList,
+    SkipList, UnrolledLinkedList, SelfOrganizingList, XORLinkedList, NodePool, SinglyNode,
+)
+from persistent_lists import PersistentDeque
+from concurrent_lists import CoarseLockedList, HandOverHandList, RWLockList
+from numeric_lists import NumericLinkedList
+from list_algorithms import floyd_cycle, brent_cycle, merge_k_chains
+from scheduling import RoundRobinScheduler, simulate, simulate_deque
+from timing_wheel import TimingWheel, HeapTimerQueue
+from caches import LRUCache, LFUCache
+
+
+def time_call(func, *args, repeat=3):
+    """Return the best wall-clock time of `repeat` calls to func(*args)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_table(title, headers, rows):
+    """Print rows as a fixed-width text table"""
+    print(f"\n{title}")
+    widths = [max(len(str(h)), *(len(str(row[i])) for row in rows)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).rjust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(cell).rjust(w) for cell, w in zip(row, widths)))
+
+
+def measure_allocation(func, *args):
+    """Return (result, bytes still allocated by func(*args) after it returns)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func(*args)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def zipf_workload(keys, n, s=1.0, seed=None):
+    """Return n draws from keys where the k-th most popular key has weight 1/k**s.
+
+    Popularity ranks are assigned to keys in a random order, so the hot keys
+    are not simply the first ones inserted.
+    """
+    rng = random.Random(seed)
+    ranked = list(keys)
+    rng.shuffle(ranked)
+    weights = [1 / (rank ** s) for rank in range(1, len(ranked) + 1)]
+    return rng.choices(ranked, weights=weights, k=n)
+
+
+def scan_workload(keys, n, scan_length, scan_every, s=1.0, seed=None):
+    """Zipf lookups over keys interrupted every scan_every lookups by a scan
+    of scan_length keys that are never seen again (a batch job or a crawler)"""
+    hot = zipf_workload(keys, n, s=s, seed=seed)
+    workload = []
+    scanned = 0
+    for start in range(0, n, scan_every):
+        workload.extend(hot[start:start + scan_every])
+        workload.extend(("scan", scanned + i) for i in range(scan_length))
+        scanned += scan_length
+    return workload
+
+
+def build_by_appending(list_class, n):
+    """Build a list the way the playground's "Create List" button does"""
+    linked_list = list_class()
+    for value in range(n):
+        linked_list.insert_at_end(value)
+    return linked_list
+
+
+def bench_construction(sizes=(10_000, 50_000, 100_000, 200_000)):
+    """List construction via insert_at_end should scale linearly with n"""
+    rows = []
+    for list_class in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList):
+        for n in sizes:
+            seconds = time_call(build_by_appending, list_class, n)
+            rows.append((list_class.__name__, n, f"{seconds * 1000:.1f}", f"{seconds / n * 1e9:.0f}"))
+    print_table("insert_at_end construction (ns/element should stay flat)",
+                ("class", "n", "total ms", "ns/element"), rows)
+
+
+def bench_bulk_construction(n=200_000):
+    """from_iterable()/extend() against one insert_at_end call per value"""
+    values = list(range(n))
+    rows = []
+    for list_class in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList, ArenaLinkedList):
+        looped = time_call(build_by_appending, list_class, n)
+        bulk = time_call(list_class.from_iterable, values)
+        rows.append((list_class.__name__, n, f"{looped * 1000:.1f}", f"{bulk * 1000:.1f}", f"{looped / bulk:.2f}x"))
+    print_table("Bulk construction", ("class", "n", "insert_at_end ms", "from_iterable ms", "speedup"), rows)
+
+
+def bench_arena(n=1_000_000):
+    """Node-per-object DoublyLinkedList against the array-backed ArenaLinkedList"""
+    rows = []
+    for list_class in (DoublyLinkedList, ArenaLinkedList):
+        linked_list, allocated = measure_allocation(build_by_appending, list_class, n)
+        build_seconds = time_call(build_by_appending, list_class, n, repeat=1)
+        traverse_seconds = time_call(linked_list.traverse_forward)
+        start = time.perf_counter()
+        gc.collect()
+        gc_seconds = time.perf_counter() - start
+        rows.append((list_class.__name__, n, f"{allocated / n:.1f}", f"{build_seconds * 1000:.0f}",
+                     f"{traverse_seconds * 1000:.0f}", f"{gc_seconds * 1000:.1f}"))
+        del linked_list
+    print_table(f"Arena vs node objects at n={n:,} (int payloads)",
+                ("class", "n", "bytes/element", "build ms", "traverse ms", "full gc ms"), rows)
+
+
+class LegacyNode:
+    """The original dict-backed Node with a prev field, kept for comparison"""
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+def build_legacy_chain(n):
+    head = tail = LegacyNode(0)
+    for value in range(1, n):
+        tail.next = LegacyNode(value)
+        tail = tail.next
+    return head
+
+
+def bench_node_memory(n=1_000_000):
+    """tracemalloc bytes per node for slotted nodes against the legacy dict-backed Node"""
+    rows = []
+    builders = [("LegacyNode chain", build_legacy_chain)]
+    for list_class in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList):
+        builders.append((list_class.__name__, lambda n, list_class=list_class: build_by_appending(list_class, n)))
+    for name, builder in builders:
+        # Every row allocates the same int payloads, so differences are node overhead
+        result, allocated = measure_allocation(builder, n)
+        rows.append((name, n, f"{allocated / n:.1f}"))
+        del result
+    print_table(f"Memory per node at n={n:,} (includes the int payload)",
+                ("structure", "n", "bytes/node"), rows)
+
+
+def build_then_delete(list_class, values, targets):
+    linked_list = list_class.from_iterable(values)
+    for value in targets:
+        linked_list.delete_by_value(value)
+
+
+def bench_indexed(sizes=(100, 1_000, 10_000), lookups=(1, 4, 16, 64, 256)):
+    """Build a list of n values, then delete k of them by value, with and without the index"""
+    pairs = [(SinglyLinkedList, IndexedSinglyLinkedList),
+             (DoublyLinkedList, IndexedDoublyLinkedList),
+             (CircularLinkedList, IndexedCircularLinkedList)]
+    rng = random.Random(42)
+    rows = []
+    for plain_class, indexed_class in pairs:
+        for n in sizes:
+            values = list(range(n))
+            rng.shuffle(values)
+            speedups = []
+            crossover = "never"
+            for k in lookups:
+                targets = rng.sample(values, min(k, n))
+                plain = time_call(build_then_delete, plain_class, values, targets)
+                indexed = time_call(build_then_delete, indexed_class, values, targets)
+                speedups.append(f"{plain / indexed:.2f}x")
+                if crossover == "never" and indexed < plain:
+                    crossover = f"k={k}"
+            plain_bytes = plain_class.from_iterable(values).memory_usage()["total"] / n
+            indexed_bytes = indexed_class.from_iterable(values).memory_usage()["total"] / n
+            rows.append((plain_class.__name__, n, *speedups, crossover, f"{plain_bytes:.0f}", f"{indexed_bytes:.0f}"))
+    print_table("Indexed speedup: build n values, then k delete_by_value calls (>1x means the index pays off)",
+                ("class", "n", *(f"k={k}" for k in lookups), "pays off from", "plain B/elem", "indexed B/elem"), rows)
+
+
+class _NoFingerMixin:
+    """Forget the finger before every positional lookup, i.e. the old walk from the ends"""
+    def _node_at(self, index):
+        self._finger = None
+        return super()._node_at(index)
+
+    def _slot_at(self, index):
+        self._finger = None
+        return super()._slot_at(index)
+
+
+def interleave(linked_list, n):
+    # Insert a new value after every existing one, front to back
+    for i in range(n):
+        linked_list.insert_at_index(-i, 2 * i + 1)
+
+
+def bench_finger(sizes=(1_000, 4_000, 10_000)):
+    """Sequential insert_at_index with and without the finger cache"""
+    rows = []
+    for list_class in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList, ArenaLinkedList):
+        no_finger_class = type(f"NoFinger{list_class.__name__}", (_NoFingerMixin, list_class), {})
+        for n in sizes:
+            walked = time_call(lambda: interleave(no_finger_class.from_iterable(range(n)), n), repeat=1)
+            fingered = time_call(lambda: interleave(list_class.from_iterable(range(n)), n), repeat=1)
+            rows.append((list_class.__name__, n, f"{walked * 1000:.1f}", f"{fingered * 1000:.1f}",
+                         f"{fingered / n * 1e9:.0f}", f"{walked / fingered:.1f}x"))
+    print_table("Interleaving n inserts with insert_at_index (finger ns/insert should stay flat)",
+                ("class", "n", "no finger ms", "finger ms", "finger ns/insert", "speedup"), rows)
+
+
+def search_all(linked_list, targets):
+    for value in targets:
+        linked_list.search(value)
+
+
+def bench_skip_list(sizes=(1_000, 10_000, 100_000), lookups=500):
+    """Sorted lookups: SkipList.search against the linear search() of the plain lists"""
+    rng = random.Random(7)
+    rows = []
+    for n in sizes:
+        values = sorted(rng.sample(range(n * 10), n))
+        targets = [rng.choice(values) for _ in range(lookups)]
+        skip_list = SkipList.from_iterable(values, seed=1)
+        row = [n, f"{time_call(search_all, skip_list, targets) / lookups * 1e6:.2f}"]
+        for list_class in (SinglyLinkedList, DoublyLinkedList):
+            linked_list = list_class.from_iterable(values)
+            row.append(f"{time_call(search_all, linked_list, targets, repeat=1) / lookups * 1e6:.1f}")
+        rows.append(tuple(row))
+    print_table(f"search() cost on sorted data, {lookups} random hits (us/lookup)",
+                ("n", "SkipList", "SinglyLinkedList", "DoublyLinkedList"), rows)
+
+
+def drain(iterable):
+    for _ in iterable:
+        pass
+
+
+def get_all(linked_list, indices):
+    for index in indices:
+        linked_list.get(index)
+
+
+def bench_unrolled(n=200_000, block_sizes=(4, 16, 64, 256), lookups=200):
+    """Block size sweep for UnrolledLinkedList against SinglyLinkedList"""
+    rng = random.Random(3)
+    indices = [rng.randrange(n) for _ in range(lookups)]
+    candidates = [("SinglyLinkedList", lambda: SinglyLinkedList.from_iterable(range(n)))]
+    for block_size in block_sizes:
+        candidates.append((f"Unrolled(block_size={block_size})",
+                           lambda block_size=block_size: UnrolledLinkedList.from_iterable(range(n), block_size=block_size)))
+    rows = []
+    for name, build in candidates:
+        linked_list, allocated = measure_allocation(build)
+        traverse = time_call(drain, linked_list)
+        indexed = time_call(get_all, linked_list, indices, repeat=1)
+        rows.append((name, f"{allocated / n:.1f}", f"{traverse * 1000:.1f}", f"{indexed / lookups * 1e6:.1f}"))
+        del linked_list
+    print_table(f"Unrolled linked list block sizes at n={n:,}",
+                ("structure", "bytes/element", "iterate ms", "get(i) us"), rows)
+
+
+def bench_self_organizing(keys=1_000, lookups=50_000, skews=(0.0, 0.8, 1.2)):
+    """Average search depth and time per strategy on Zipf-distributed lookups"""
+    rows = []
+    for skew in skews:
+        workload = zipf_workload(range(keys), lookups, s=skew, seed=11)
+        static = SinglyLinkedList.from_iterable(range(keys))
+        start = time.perf_counter()
+        depth = sum(static.search(key) + 1 for key in workload) / lookups
+        rows.append((skew, "static SinglyLinkedList", f"{depth:.1f}", f"{(time.perf_counter() - start) * 1000:.0f}"))
+        for strategy in SelfOrganizingList.STRATEGIES:
+            linked_list = SelfOrganizingList.from_iterable(range(keys), strategy=strategy)
+            start = time.perf_counter()
+            search_all(linked_list, workload)
+            rows.append((skew, strategy, f"{linked_list.average_search_depth:.1f}",
+                         f"{(time.perf_counter() - start) * 1000:.0f}"))
+    print_table(f"Self-organizing strategies, {keys} keys, {lookups:,} Zipf lookups (s=0 is uniform)",
+                ("zipf s", "strategy", "avg depth", "total ms"), rows)
+
+
+def bench_xor(n=1_000_000):
+    """XOR-linked arena against DoublyLinkedList and the two-array ArenaLinkedList"""
+    rows = []
+    for list_class in (DoublyLinkedList, ArenaLinkedList, XORLinkedList):
+        linked_list, allocated = measure_allocation(list_class.from_iterable, range(n))
+        forward = time_call(drain, linked_list)
+        backward = time_call(drain, reversed(linked_list), repeat=1)
+        rows.append((list_class.__name__, n, f"{allocated / n:.1f}",
+                     f"{n / forward / 1e6:.1f}", f"{n / backward / 1e6:.1f}"))
+        del linked_list
+    print_table(f"XOR linked list at n={n:,} (int payloads)",
+                ("class", "n", "bytes/element", "forward M elem/s", "backward M elem/s"), rows)
+
+
+def bench_sort(sizes=(10_000, 100_000, 300_000)):
+    """In-place sort() against copying the values out, sorted() and rebuilding the list"""
+    rng = random.Random(5)
+    rows = []
+    for list_class in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList):
+        for n in sizes:
+            values = [rng.random() for _ in range(n)]
+            linked_list = list_class.from_iterable(values)
+            start = time.perf_counter()
+            linked_list.sort()
+            in_place = time.perf_counter() - start
+            linked_list = list_class.from_iterable(values)
+            start = time.perf_counter()
+            linked_list = list_class.from_iterable(sorted(linked_list))
+            rebuilt = time.perf_counter() - start
+            rows.append((list_class.__name__, n, f"{in_place * 1000:.0f}", f"{rebuilt * 1000:.0f}"))
+    print_table("Sorting random floats", ("class", "n", "sort() ms", "sorted() + rebuild ms"), rows)
+
+
+def history_of_copies(n, edits):
+    linked_list = DoublyLinkedList.from_iterable(range(n))
+    history = []
+    for i in range(edits):
+        history.append(DoublyLinkedList.from_iterable(linked_list))
+        linked_list.insert_at_beginning(i) if i % 2 else linked_list.insert_at_end(i)
+    return history
+
+
+def history_of_versions(n, edits):
+    version = PersistentDeque.from_iterable(range(n))
+    history = []
+    for i in range(edits):
+        history.append(version)
+        version = version.push_front(i) if i % 2 else version.push_back(i)
+    return history
+
+
+def bench_undo_history(sizes=(100, 1_000, 5_000), edits=200):
+    """Memory held per undo step: a full list copy per edit against persistent versions"""
+    rows = []
+    for n in sizes:
+        # Subtract the live list itself so only the history is counted
+        base, base_bytes = measure_allocation(DoublyLinkedList.from_iterable, range(n))
+        del base
+        copies, copy_bytes = measure_allocation(history_of_copies, n, edits)
+        del copies
+        base, version_base_bytes = measure_allocation(PersistentDeque.from_iterable, range(n))
+        del base
+        versions, version_bytes = measure_allocation(history_of_versions, n, edits)
+        del versions
+        rows.append((n, edits, f"{(copy_bytes - base_bytes) / edits:.0f}",
+                     f"{(version_bytes - version_base_bytes) / edits:.0f}"))
+    print_table("Undo history memory for head/tail edits (bytes per edit)",
+                ("list size", "edits", "list copies", "persistent versions"), rows)
+
+
+def build_rho(tail_length, cycle_length):
+    """Build a chain of tail_length nodes leading into a cycle of cycle_length nodes"""
+    head = last = SinglyNode(0)
+    for value in range(1, tail_length + cycle_length):
+        last.next = last = SinglyNode(value)
+    if cycle_length:
+        entry = head
+        for i in range(tail_length):
+            entry = entry.next
+        last.next = entry
+    return head
+
+
+def bench_cycle_detection(n=1_000_000, cycle_fractions=(0.0, 1e-6, 0.001, 0.5, 1.0)):
+    """Pointer steps of Floyd and Brent on n-node chains with varying tail/cycle split"""
+    rows = []
+    for fraction in cycle_fractions:
+        cycle_length = max(1, round(n * fraction)) if fraction else 0
+        tail_length = n - cycle_length
+        head = build_rho(tail_length, cycle_length)
+        for name, find in (("Floyd", floyd_cycle), ("Brent", brent_cycle)):
+            start = time.perf_counter()
+            info = find(head)
+            seconds = time.perf_counter() - start
+            rows.append((tail_length, cycle_length, name, f"{info.detect_steps:,}", f"{info.steps:,}",
+                         f"{info.steps / n:.2f}", f"{seconds * 1000:.0f}"))
+        del head
+        gc.collect()
+    print_table(f"Cycle detection on {n:,}-node chains",
+                ("tail (mu)", "cycle (lambda)", "algorithm", "detect steps", "total steps", "steps/node", "ms"), rows)
+
+
+def sorted_streams(k, n, seed=0):
+    """Return k sorted lists of random timestamps holding n values in total"""
+    rng = random.Random(seed)
+    return [sorted(rng.random() for _ in range(n // k)) for _ in range(k)]
+
+
+def bench_merge_k(ks=(2, 8, 64, 512, 4096), sizes=(100_000, 1_000_000)):
+    """merge_k_chains strategies against heapq.merge over Python lists"""
+    rows = []
+    for n in sizes:
+        for k in ks:
+            streams = sorted_streams(k, n)
+            timings = []
+            for strategy in ("heap", "pairwise"):
+                heads = [SinglyLinkedList.from_iterable(stream).head for stream in streams]
+                start = time.perf_counter()
+                merge_k_chains(heads, strategy)
+                timings.append(time.perf_counter() - start)
+                del heads
+            start = time.perf_counter()
+            drain(heapq.merge(*streams))
+            timings.append(time.perf_counter() - start)
+            rows.append((n, k, *(f"{seconds * 1000:.0f}" for seconds in timings)))
+    print_table("Merging k sorted streams of n values in total (ms)",
+                ("n", "k", "heap", "pairwise", "heapq.merge (lists)"), rows)
+
+
+def bench_round_robin(slices=2_000_000, task_counts=(4, 64, 4096), quanta=(1, 8)):
+    """Dispatch overhead per time slice: RoundRobinScheduler against deque.rotate"""
+    rows = []
+    for tasks in task_counts:
+        for quantum in quanta:
+            weights = {f"task-{i}": 1 + i % 3 for i in range(tasks)}
+            scheduler = RoundRobinScheduler(quantum)
+            for task, weight in weights.items():
+                scheduler.add(task, weight)
+            report = simulate(scheduler, slices)
+            baseline = simulate_deque(weights, slices, quantum)
+            rows.append((tasks, quantum, f"{report.turns:,}",
+                         f"{report.seconds / slices * 1e9:.1f}", f"{baseline.seconds / slices * 1e9:.1f}"))
+    print_table(f"Weighted round-robin over {slices:,} time slices (weights 1-3)",
+                ("tasks", "quantum", "dispatches", "scheduler ns/slice", "deque.rotate ns/slice"), rows)
+
+
+def run_timers(queue, delays, cancel_every):
+    """Schedule a timer per delay, cancel every cancel_every-th one, then run
+    the queue until all have fired; return (schedule, cancel, advance) seconds"""
+    start = time.perf_counter()
+    timers = [queue.schedule(delay) for delay in delays]
+    scheduled = time.perf_counter()
+    if cancel_every:
+        for timer in timers[::cancel_every]:
+            queue.cancel(timer)
+    cancelled = time.perf_counter()
+    queue.advance(max(delays))
+    return scheduled - start, cancelled - scheduled, time.perf_counter() - cancelled
+
+
+def bench_timing_wheel(timers=1_000_000, max_delay=10_000, cancel_everies=(0, 2, 1)):
+    """Schedule, cancel and expire timers: TimingWheel against a heapq timer queue"""
+    rng = random.Random(0)
+    delays = [rng.randint(1, max_delay) for _ in range(timers)]
+    rows = []
+    for cancel_every in cancel_everies:
+        cancelled = timers // cancel_every if cancel_every else 0
+        for name, queue_class in (("TimingWheel", TimingWheel), ("heapq", HeapTimerQueue)):
+            gc.collect()
+            schedule, cancel, advance = run_timers(queue_class(), delays, cancel_every)
+            rows.append((name, f"{cancelled:,}", f"{schedule / timers * 1e9:.0f}",
+                         f"{cancel / cancelled * 1e9:.0f}" if cancelled else "-",
+                         f"{advance * 1000:.0f}"))
+    print_table(f"{timers:,} timers with delays of 1-{max_delay:,} ticks",
+                ("queue", "cancelled", "schedule ns/timer", "cancel ns/timer", "advance all ms"), rows)
+
+
+def replay_cache(cache, keys):
+    """Look up each key in a library cache, storing it on a miss; return (hit rate, seconds)"""
+    missing = cache.MISSING
+    get, put = cache.get, cache.put
+    start = time.perf_counter()
+    for key in keys:
+        if get(key, missing) is missing:
+            put(key, key)
+    return cache.hit_rate, time.perf_counter() - start
+
+
+def replay_lru_cache(keys, capacity):
+    return replay_cache(LRUCache(capacity), keys)
+
+
+def replay_ordered_dict(keys, capacity):
+    cache = OrderedDict()
+    hits = 0
+    start = time.perf_counter()
+    for key in keys:
+        if key in cache:
+            cache.move_to_end(key)
+            hits += 1
+        else:
+            cache[key] = key
+            if len(cache) > capacity:
+                cache.popitem(last=False)
+    return hits / len(keys), time.perf_counter() - start
+
+
+def replay_functools(keys, capacity):
+    cached = functools.lru_cache(maxsize=capacity)(lambda key: key)
+    start = time.perf_counter()
+    for key in keys:
+        cached(key)
+    seconds = time.perf_counter() - start
+    return cached.cache_info().hits / len(keys), seconds
+
+
+def cache_workloads(n, keys, capacity):
+    """Named key streams: Zipf popularity and a loop scanning past the capacity"""
+    rng = random.Random(5)
+    return {
+        "zipf s=0.8": zipf_workload(range(keys), n, s=0.8, seed=5),
+        "zipf s=1.2": zipf_workload(range(keys), n, s=1.2, seed=5),
+        "uniform": [rng.randrange(keys) for _ in range(n)],
+        "loop scan": [i % (capacity + capacity // 10) for i in range(n)],
+    }
+
+
+def bench_lru_cache(n=1_000_000, keys=100_000, capacity=10_000):
+    """Hit rate and ns per lookup: LRUCache against OrderedDict and functools.lru_cache"""
+    rows = []
+    for workload, stream in cache_workloads(n, keys, capacity).items():
+        for name, replay in (("LRUCache", replay_lru_cache), ("OrderedDict", replay_ordered_dict),
+                             ("functools.lru_cache", replay_functools)):
+            hit_rate, seconds = replay(stream, capacity)
+            rows.append((workload, name, f"{hit_rate:.1%}", f"{seconds / n * 1e9:.0f}"))
+    print_table(f"{n:,} lookups over {keys:,} keys, capacity {capacity:,}",
+                ("workload", "cache", "hit rate", "ns/lookup"), rows)
+
+
+def bench_lfu_cache(n=1_000_000, keys=100_000, capacity=10_000):
+    """Hit rate and ns per lookup of LFUCache against LRUCache on Zipf and scan-heavy streams"""
+    workloads = {
+        "zipf s=0.8": zipf_workload(range(keys), n, s=0.8, seed=5),
+        "zipf s=1.2": zipf_workload(range(keys), n, s=1.2, seed=5),
+        # Popularity is reshuffled halfway through
+        "zipf shift": zipf_workload(range(keys), n // 2, seed=5) + zipf_workload(range(keys), n // 2, seed=6),
+        "zipf + scans": scan_workload(range(keys), n, scan_length=capacity * 2, scan_every=n // 10, seed=5),
+    }
+    caches = {
+        "LRUCache": lambda: LRUCache(capacity),
+        "LFUCache": lambda: LFUCache(capacity),
+        "LFUCache mru ties": lambda: LFUCache(capacity, tie_break="mru"),
+        "LFUCache aging": lambda: LFUCache(capacity, aging=True),
+    }
+    rows = []
+    for workload, stream in workloads.items():
+        for name, make_cache in caches.items():
+            hit_rate, seconds = replay_cache(make_cache(), stream)
+            rows.append((workload, name, f"{hit_rate:.1%}", f"{seconds / len(stream) * 1e9:.0f}"))
+    print_table(f"~{n:,} lookups over {keys:,} keys, capacity {capacity:,}",
+                ("workload", "cache", "hit rate", "ns/lookup"), rows)
+
+
+def walk_aggregates(linked_list):
+    return sum(linked_list), min(linked_list), max(linked_list)
+
+
+def vectorized_aggregates(linked_list):
+    return linked_list.sum(), linked_list.min(), linked_list.max()
+
+
+def bench_numeric(node_n=1_000_000, numeric_sizes=(1_000_000, 10_000_000)):
+    """sum/min/max by walking nodes against NumericLinkedList's vectorized calls"""
+    rows = []
+    linked_list = SinglyLinkedList.from_iterable(range(node_n))
+    seconds = time_call(walk_aggregates, linked_list, repeat=1)
+    rows.append(("SinglyLinkedList (walk)", node_n, f"{seconds * 1000:.0f}", f"{seconds / node_n * 1e9:.1f}"))
+    del linked_list
+    for n in numeric_sizes:
+        numeric = NumericLinkedList.from_iterable(range(n), dtype='int64')
+        seconds = time_call(vectorized_aggregates, numeric)
+        rows.append(("NumericLinkedList", n, f"{seconds * 1000:.0f}", f"{seconds / n * 1e9:.1f}"))
+        # Holes left by deletes cost one masked copy per aggregate
+        for i in range(0, n, 1000):
+            numeric.delete_from_beginning()
+        numeric.insert_at_index(-1, len(numeric) // 2)
+        seconds = time_call(vectorized_aggregates, numeric)
+        rows.append(("NumericLinkedList (after edits)", n, f"{seconds * 1000:.0f}", f"{seconds / n * 1e9:.1f}"))
+    print_table("sum + min + max over int64 values", ("list", "n", "ms", "ns/element"), rows)
+
+
+def churn(linked_list, operations, seed=0):
+    """Sustained 50/50 mix of insert_at_end and delete_from_beginning (a busy queue)"""
+    rng = random.Random(seed)
+    coin = [rng.random() < 0.5 for _ in range(operations)]
+    start = time.perf_counter()
+    for insert in coin:
+        if insert:
+            linked_list.insert_at_end(0)
+        else:
+            linked_list.delete_from_beginning()
+    return time.perf_counter() - start
+
+
+def bench_node_pool(sizes=(100, 10_000), operations=1_000_000, capacity=1024):
+    """Insert/delete churn with plain allocation against a recycling NodePool"""
+    rows = []
+    for list_class in (SinglyLinkedList, DoublyLinkedList):
+        for n in sizes:
+            for pooled in (False, True):
+                linked_list = list_class.from_iterable(range(n))
+                pool = NodePool(list_class.node_class, capacity)
+                if pooled:
+                    linked_list.attach_pool(pool)
+                gc.collect()
+                collections_before = gc.get_stats()[0]["collections"]
+                seconds = churn(linked_list, operations)
+                collections = gc.get_stats()[0]["collections"] - collections_before
+                rows.append((list_class.__name__, n, "pool" if pooled else "plain",
+                             f"{seconds / operations * 1e9:.0f}", collections,
+                             f"{pool.hit_rate:.0%}" if pooled else "-"))
+    print_table(f"{operations:,} churn operations (50% insert_at_end, 50% delete_from_beginning)",
+                ("class", "start size", "nodes", "ns/op", "gen0 GCs", "pool hit rate"), rows)
+
+
+def dump_to_bytes(linked_list):
+    buffer = io.BytesIO()
+    linked_list.dump(buffer)
+    return buffer.getvalue()
+
+
+def bench_serialization(sizes=(10_000, 100_000, 1_000_000)):
+    """Pickle, deepcopy and binary dump round trips of large lists"""
+    rows = []
+    for list_class in (SinglyLinkedList, DoublyLinkedList):
+        for n in sizes:
+            linked_list = list_class.from_iterable(range(n))
+            pickled = pickle.dumps(linked_list, protocol=pickle.HIGHEST_PROTOCOL)
+            dumped = dump_to_bytes(linked_list)
+            pickle_seconds = time_call(lambda: pickle.loads(pickle.dumps(linked_list)), repeat=1)
+            deepcopy_seconds = time_call(copy.deepcopy, linked_list, repeat=1)
+            dump_seconds = time_call(lambda: list_class.load(io.BytesIO(dump_to_bytes(linked_list))), repeat=1)
+            rows.append((list_class.__name__, n, f"{pickle_seconds * 1000:.0f}", f"{deepcopy_seconds * 1000:.0f}",
+                         f"{dump_seconds * 1000:.0f}", f"{len(pickled) / n:.1f}", f"{len(dumped) / n:.1f}"))
+    print_table("Serialization round trips (pickle used to overflow the stack past ~1k nodes)",
+                ("class", "n", "pickle ms", "deepcopy ms", "dump/load ms", "pickle B/elem", "dump B/elem"), rows)
+
+
+def run_contention(linked_list, threads, ops_per_thread, read_ratio, keys, seed=0):
+    """Drive a shared list from several threads; return (ops/sec, p99 latency in µs).
+
+    Reads are search() calls; writes alternate between inserting a key at
+    the front and deleting a key by value, so the list size stays roughly
+    constant.
+    """
+    latencies = []
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(worker_id):
+        rng = random.Random(seed + worker_id)
+        local = []
+        start_barrier.wait()
+        for i in range(ops_per_thread):
+            key = rng.randrange(keys)
+            if rng.random() < read_ratio:
+                begin = time.perf_counter()
+                linked_list.search(key)
+            elif i % 2:
+                begin = time.perf_counter()
+                linked_list.insert_at_beginning(key)
+            else:
+                begin = time.perf_counter()
+                linked_list.delete_by_value(key)
+            local.append(time.perf_counter() - begin)
+        latencies.extend(local)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return threads * ops_per_thread / elapsed, p99 * 1e6
+
+
+def bench_concurrency(threads=(1, 2, 4, 8), read_ratios=(0.9, 0.5), keys=500, ops_per_thread=2_000):
+    """Throughput and tail latency of the thread-safe lists under mixed workloads"""
+    variants = {
+        "coarse lock": lambda: CoarseLockedList(SinglyLinkedList.from_iterable(range(keys))),
+        "hand-over-hand": lambda: HandOverHandList.from_iterable(range(keys)),
+        "readers-writer": lambda: RWLockList(SinglyLinkedList.from_iterable(range(keys))),
+    }
+    rows = []
+    for read_ratio in read_ratios:
+        for name, make in variants.items():
+            for count in threads:
+                ops_per_sec, p99 = run_contention(make(), count, ops_per_thread, read_ratio, keys)
+                rows.append((name, f"{read_ratio:.0%}", count, f"{ops_per_sec:,.0f}", f"{p99:.0f}"))
+    print_table(f"Shared list of ~{keys} keys under contention",
+                ("variant", "reads", "threads", "ops/sec", "p99 µs"), rows)
+
+
+BENCHMARKS = {
+    "construction": bench_construction,
+    "bulk_construction": bench_bulk_construction,
+    "arena": bench_arena,
+    "indexed": bench_indexed,
+    "finger": bench_finger,
+    "skip_list": bench_skip_list,
+    "unrolled": bench_unrolled,
+    "self_organizing": bench_self_organizing,
+    "xor": bench_xor,
+    "sort": bench_sort,
+    "undo_history": bench_undo_history,
+    "concurrency": bench_concurrency,
+    "serialization": bench_serialization,
+    "node_pool": bench_node_pool,
+    "numeric": bench_numeric,
+    "cycle_detection": bench_cycle_detection,
+    "merge_k": bench_merge_k,
+    "round_robin": bench_round_robin,
+    "timing_wheel": bench_timing_wheel,
+    "lru_cache": bench_lru_cache,
+    "lfu_cache": bench_lfu_cache,
+    "node_memory": bench_node_memory,
+}
+
+
+def main(names):
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark '{name}'. Choose from: {', '.join(BENCHMARKS)}")
+            return 1
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,408 @@
+# Caches
+# Working versions of the cache patterns shown in the app: an LRU cache
+# whose recency order is a doubly linked list of entries around a sentinel
+# node, and an LFU cache whose frequency buckets are a DoublyLinkedList of
+# key lists. Both keep a dict from key to entry for O(1) lookups.
+
+import time
+
+from linked_list_classes import DoublyNode, DoublyLinkedList, payload_size
+
+
+class CacheEntry(DoublyNode):
+    """Doubly linked node holding one cached value (data) and its key"""
+    __slots__ = ('key', 'expires', 'size')
+
+    def __init__(self, key, data, expires=None, size=0):
+        self.key = key
+        self.data = data
+        self.expires = expires  # Clock time after which the entry is stale
+        self.size = size
+
+
+def value_size(value):
+    """Default size function for byte-size capacity: deep bytes of value"""
+    return payload_size((value,))
+
+
+class LRUCache:
+    """Least-recently-used cache with O(1) get, put and eviction.
+
+    Entries form a circular doubly linked list through a sentinel node:
+    sentinel.next is the most recently used entry and sentinel.prev the
+    least recently used, so moving or unlinking an entry never has to
+    check for the ends of the list.
+
+    capacity limits the number of entries and max_bytes the summed
+    sizeof(value) of all values (either may be None, not both). ttl is a
+    default lifetime in clock() seconds; expired entries are dropped when
+    they are next looked up or by purge_expired(). on_evict(key, value,
+    reason) is called for each entry dropped by the cache itself, with
+    reason "capacity" or "expired"; delete(), clear() and overwrites by
+    put() don't call it.
+    """
+    MISSING = object()
+
+    def __init__(self, capacity=128, max_bytes=None, ttl=None, on_evict=None,
+                 sizeof=value_size, clock=time.monotonic):
+        if capacity is None and max_bytes is None:
+            raise ValueError("Set capacity, max_bytes or both")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.sizeof = sizeof
+        self.clock = clock
+        self.entries = {}
+        self.sentinel = DoublyNode(None)
+        self.sentinel.next = self.sentinel.prev = self.sentinel
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _link_front(self, entry):
+        sentinel = self.sentinel
+        first = sentinel.next
+        entry.prev = sentinel
+        entry.next = first
+        first.prev = entry
+        sentinel.next = entry
+
+    def _unlink(self, entry):
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        del self.entries[entry.key]
+        self.bytes -= entry.size
+
+    def _drop(self, entry, reason):
+        self._unlink(entry)
+        if reason == "expired":
+            self.expirations += 1
+        else:
+            self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.data, reason)
+
+    def _live_entry(self, key):
+        # Return the entry for key, dropping it first if it has expired
+        entry = self.entries.get(key)
+        if entry is not None and entry.expires is not None and entry.expires <= self.clock():
+            self._drop(entry, "expired")
+            return None
+        return entry
+
+    def get(self, key, default=None):
+        """Return the value for key and mark it most recently used, or default"""
+        entry = self.entries.get(key)
+        if entry is None or (entry.expires is not None and entry.expires <= self.clock()):
+            if entry is not None:
+                self._drop(entry, "expired")
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.sentinel.next is not entry:
+            entry.prev.next = entry.next
+            entry.next.prev = entry.prev
+            self._link_front(entry)
+        return entry.data
+
+    def put(self, key, value, ttl=None):
+        """Store value as the most recently used entry and evict down to capacity.
+
+        ttl overrides the cache's default lifetime for this entry. A value
+        larger than max_bytes on its own raises ValueError.
+        """
+        max_bytes = self.max_bytes
+        size = 0
+        if max_bytes is not None:
+            size = self.sizeof(value)
+            if size > max_bytes:
+                raise ValueError(f"Value of {size} bytes exceeds max_bytes={max_bytes}")
+        if ttl is None:
+            ttl = self.ttl
+        expires = None if ttl is None else self.clock() + ttl
+        entries = self.entries
+        sentinel = self.sentinel
+        entry = entries.get(key)
+        if entry is not None:
+            self._unlink(entry)
+        elif self.capacity is not None and len(entries) >= self.capacity:
+            # Full: evict first and reuse the evicted entry instead of
+            # allocating a new one
+            entry = sentinel.prev
+            self._drop(entry, "capacity")
+        if entry is None:
+            entry = CacheEntry(key, value, expires, size)
+        else:
+            entry.key = key
+            entry.data = value
+            entry.expires = expires
+            entry.size = size
+        entries[key] = entry
+        first = sentinel.next
+        entry.prev = sentinel
+        entry.next = first
+        first.prev = sentinel.next = entry
+        if max_bytes is not None:
+            self.bytes += size
+            while self.bytes > max_bytes:
+                self._drop(sentinel.prev, "capacity")
+
+    def delete(self, key):
+        """Remove key without calling on_evict; return False if it was not cached"""
+        entry = self._live_entry(key)
+        if entry is None:
+            return False
+        self._unlink(entry)
+        return True
+
+    def peek(self, key, default=None):
+        """Return the value for key without touching recency or counters"""
+        entry = self._live_entry(key)
+        return default if entry is None else entry.data
+
+    def purge_expired(self):
+        """Drop every expired entry (O(n)); return how many were dropped"""
+        now = self.clock()
+        stale = [entry for entry in self.entries.values()
+                 if entry.expires is not None and entry.expires <= now]
+        for entry in stale:
+            self._drop(entry, "expired")
+        return len(stale)
+
+    def clear(self):
+        self.entries.clear()
+        self.sentinel.next = self.sentinel.prev = self.sentinel
+        self.bytes = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate,
+            'evictions': self.evictions, 'expirations': self.expirations,
+            'entries': len(self.entries), 'bytes': self.bytes,
+        }
+
+    def keys(self):
+        """Keys from most to least recently used (expired ones included until dropped)"""
+        keys = []
+        entry = self.sentinel.next
+        while entry is not self.sentinel:
+            keys.append(entry.key)
+            entry = entry.next
+        return keys
+
+    def __getitem__(self, key):
+        value = self.get(key, self.MISSING)
+        if value is self.MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return self._live_entry(key) is not None
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class FrequencyBucket:
+    """Keys used `count` times, oldest first"""
+    __slots__ = ('count', 'keys')
+
+    def __init__(self, count):
+        self.count = count
+        self.keys = DoublyLinkedList()
+
+
+class LFUEntry:
+    """Value of a cached key and the nodes holding it in the bucket lists"""
+    __slots__ = ('data', 'bucket_node', 'key_node')
+
+    def __init__(self, data, bucket_node, key_node):
+        self.data = data
+        self.bucket_node = bucket_node  # Node of buckets holding our FrequencyBucket
+        self.key_node = key_node  # Node of that bucket's keys holding the key
+
+
+class LFUCache:
+    """Least-frequently-used cache with O(1) get, put and eviction.
+
+    buckets is a DoublyLinkedList of FrequencyBuckets in increasing count
+    order, and each bucket keeps its keys in a DoublyLinkedList. A hit
+    moves the key to the bucket right after its own (creating it if the
+    next count is missing), so the least frequently used keys are always
+    in the head bucket.
+
+    tie_break picks the victim among keys with the lowest count: "lru"
+    evicts the one that reached that count first, "mru" the latest. With
+    aging=True the cache uses dynamic aging (LFU-DA): each eviction raises
+    age to the victim's count and new keys start at age + 1, so keys that
+    were popular long ago can't hold the cache against new hot keys.
+    on_evict(key, value, "capacity") is called for each eviction.
+    """
+    MISSING = object()
+    TIE_BREAKS = ("lru", "mru")
+
+    def __init__(self, capacity=128, tie_break="lru", aging=False, on_evict=None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if tie_break not in self.TIE_BREAKS:
+            raise ValueError(f"Unknown tie_break '{tie_break}'. Choose from: {', '.join(self.TIE_BREAKS)}")
+        self.capacity = capacity
+        self.tie_break = tie_break
+        self.aging = aging
+        self.on_evict = on_evict
+        self.entries = {}
+        self.buckets = DoublyLinkedList()
+        self.age = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _touch(self, entry, key):
+        # Move key from its bucket to the one with the next count
+        bucket_node = entry.bucket_node
+        bucket = bucket_node.data
+        count = bucket.count + 1
+        next_node = bucket_node.next
+        if next_node is None or next_node.data.count != count:
+            if bucket.keys.size == 1:
+                # The key's own bucket can just take the next count
+                bucket.count = count
+                return
+            next_node = self.buckets.insert_after(bucket_node, FrequencyBucket(count))
+        bucket.keys.remove_node(entry.key_node)
+        if bucket.keys.head is None:
+            self.buckets.remove_node(bucket_node)
+        keys = next_node.data.keys
+        keys.insert_at_end(key)
+        entry.bucket_node = next_node
+        entry.key_node = keys.tail
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        bucket_node = entry.bucket_node
+        keys = bucket_node.data.keys
+        keys.remove_node(entry.key_node)
+        if keys.head is None:
+            self.buckets.remove_node(bucket_node)
+        return entry
+
+    def _evict(self):
+        bucket = self.buckets.head.data
+        key = bucket.keys.head.data if self.tie_break == "lru" else bucket.keys.tail.data
+        entry = self._remove(key)
+        self.evictions += 1
+        if self.aging:
+            self.age = bucket.count
+        if self.on_evict is not None:
+            self.on_evict(key, entry.data, "capacity")
+
+    def _insert(self, key, value):
+        # New keys start at count age + 1, which is at most one bucket
+        # past the head bucket
+        count = self.age + 1
+        buckets = self.buckets
+        bucket_node = buckets.head
+        if bucket_node is None or bucket_node.data.count > count:
+            buckets.insert_at_beginning(FrequencyBucket(count))
+            bucket_node = buckets.head
+        elif bucket_node.data.count < count:
+            next_node = bucket_node.next
+            if next_node is None or next_node.data.count != count:
+                next_node = buckets.insert_after(bucket_node, FrequencyBucket(count))
+            bucket_node = next_node
+        keys = bucket_node.data.keys
+        keys.insert_at_end(key)
+        self.entries[key] = LFUEntry(value, bucket_node, keys.tail)
+
+    def get(self, key, default=None):
+        """Return the value for key and count the use, or default"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(entry, key)
+        return entry.data
+
+    def put(self, key, value):
+        """Store value for key; overwriting a key counts as a use"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry.data = value
+            self._touch(entry, key)
+            return
+        if len(self.entries) >= self.capacity:
+            self._evict()
+        self._insert(key, value)
+
+    def delete(self, key):
+        """Remove key without calling on_evict; return False if it was not cached"""
+        if key not in self.entries:
+            return False
+        self._remove(key)
+        return True
+
+    def peek(self, key, default=None):
+        """Return the value for key without counting a use"""
+        entry = self.entries.get(key)
+        return default if entry is None else entry.data
+
+    def frequency(self, key):
+        """Return the use count of key (including age), or 0 if it is not cached"""
+        entry = self.entries.get(key)
+        return 0 if entry is None else entry.bucket_node.data.count
+
+    def clear(self):
+        self.entries.clear()
+        self.buckets = DoublyLinkedList()
+        self.age = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate,
+            'evictions': self.evictions, 'entries': len(self.entries),
+            'buckets': len(self.buckets), 'age': self.age,
+        }
+
+    def __getitem__(self, key):
+        value = self.get(key, self.MISSING)
+        if value is self.MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,278 @@
+# Concurrent Linked Lists
+# Thread-safe list variants with different locking granularity:
+#   - CoarseLockedList: one lock around any library list
+#   - HandOverHandList: a lock per node, taken in pairs while walking
+#   - RWLockList: many concurrent readers or one writer around any library list
+
+import threading
+from contextlib import contextmanager
+
+from linked_list_classes import SinglyLinkedList
+
+
+class CoarseLockedList:
+    """Wrap a library list so every operation runs under a single lock"""
+    def __init__(self, linked_list=None):
+        self.linked_list = linked_list if linked_list is not None else SinglyLinkedList()
+        self.lock = threading.Lock()
+
+    def insert_at_beginning(self, data):
+        with self.lock:
+            self.linked_list.insert_at_beginning(data)
+
+    def insert_at_end(self, data):
+        with self.lock:
+            self.linked_list.insert_at_end(data)
+
+    def insert_at_index(self, data, index):
+        with self.lock:
+            return self.linked_list.insert_at_index(data, index)
+
+    def delete_from_beginning(self):
+        with self.lock:
+            return self.linked_list.delete_from_beginning()
+
+    def delete_from_end(self):
+        with self.lock:
+            return self.linked_list.delete_from_end()
+
+    def delete_by_value(self, value):
+        with self.lock:
+            return self.linked_list.delete_by_value(value)
+
+    def search(self, value):
+        with self.lock:
+            return self.linked_list.search(value)
+
+    def traverse(self):
+        with self.lock:
+            return list(self.linked_list)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.linked_list)
+
+
+class LockedNode:
+    """Singly linked node carrying its own lock"""
+    __slots__ = ('data', 'next', 'lock')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.lock = threading.Lock()
+
+
+class HandOverHandList:
+    """Singly linked list with lock coupling (hand-over-hand locking).
+
+    A walker always holds the lock of the node it stands on and takes the
+    next node's lock before releasing it, so threads working on different
+    parts of the list don't block each other. A sentinel head node gives
+    every real node a lockable predecessor.
+    """
+    def __init__(self):
+        self.head = LockedNode(None)  # Sentinel, never removed
+        self._size = 0
+        self._size_lock = threading.Lock()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        linked_list = cls()
+        for data in iterable:
+            linked_list.insert_at_end(data)
+        return linked_list
+
+    def _resize(self, delta):
+        with self._size_lock:
+            self._size += delta
+
+    @property
+    def size(self):
+        return self._size
+
+    def _walk(self):
+        # Yield (prev, current) pairs with both locks held. A caller that
+        # stops early must release both locks itself; current is None once
+        # the walk has passed the last node.
+        prev_node = self.head
+        prev_node.lock.acquire()
+        current = prev_node.next
+        while current is not None:
+            current.lock.acquire()
+            yield prev_node, current
+            prev_node.lock.release()
+            prev_node, current = current, current.next
+        yield prev_node, None
+        prev_node.lock.release()
+
+    def insert_at_beginning(self, data):
+        new_node = LockedNode(data)
+        with self.head.lock:
+            new_node.next = self.head.next
+            self.head.next = new_node
+        self._resize(1)
+
+    def insert_at_end(self, data):
+        new_node = LockedNode(data)
+        for prev_node, current in self._walk():
+            if current is None:
+                prev_node.next = new_node
+        self._resize(1)
+
+    def insert_at_index(self, data, index):
+        if index < 0:
+            return False
+        position = 0
+        for prev_node, current in self._walk():
+            if position == index:
+                new_node = LockedNode(data)
+                new_node.next = current
+                prev_node.next = new_node
+                if current is not None:
+                    current.lock.release()
+                prev_node.lock.release()
+                self._resize(1)
+                return True
+            position += 1
+        return False
+
+    def delete_from_beginning(self):
+        with self.head.lock:
+            first = self.head.next
+            if first is None:
+                return None
+            with first.lock:
+                self.head.next = first.next
+        self._resize(-1)
+        return first.data
+
+    def delete_from_end(self):
+        for prev_node, current in self._walk():
+            if current is not None and current.next is None:
+                prev_node.next = None
+                current.lock.release()
+                prev_node.lock.release()
+                self._resize(-1)
+                return current.data
+        return None
+
+    def delete_by_value(self, value):
+        for prev_node, current in self._walk():
+            if current is not None and current.data == value:
+                prev_node.next = current.next
+                current.lock.release()
+                prev_node.lock.release()
+                self._resize(-1)
+                return True
+        return False
+
+    def search(self, value):
+        position = 0
+        for prev_node, current in self._walk():
+            if current is not None and current.data == value:
+                current.lock.release()
+                prev_node.lock.release()
+                return position
+            position += 1
+        return -1
+
+    def traverse(self):
+        return [current.data for prev_node, current in self._walk() if current is not None]
+
+    def __len__(self):
+        return self._size
+
+
+class ReadWriteLock:
+    """Readers-writer lock that lets waiting writers go before new readers"""
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class RWLockList:
+    """Wrap a library list so lookups share a read lock and updates take the write lock"""
+    def __init__(self, linked_list=None):
+        self.linked_list = linked_list if linked_list is not None else SinglyLinkedList()
+        self.lock = ReadWriteLock()
+
+    def insert_at_beginning(self, data):
+        with self.lock.write_locked():
+            self.linked_list.insert_at_beginning(data)
+
+    def insert_at_end(self, data):
+        with self.lock.write_locked():
+            self.linked_list.insert_at_end(data)
+
+    def insert_at_index(self, data, index):
+        with self.lock.write_locked():
+            return self.linked_list.insert_at_index(data, index)
+
+    def delete_from_beginning(self):
+        with self.lock.write_locked():
+            return self.linked_list.delete_from_beginning()
+
+    def delete_from_end(self):
+        with self.lock.write_locked():
+            return self.linked_list.delete_from_end()
+
+    def delete_by_value(self, value):
+        with self.lock.write_locked():
+            return self.linked_list.delete_by_value(value)
+
+    def search(self, value):
+        # search() must not mutate the wrapped list (a SelfOrganizingList would need the write lock)
+        with self.lock.read_locked():
+            return self.linked_list.search(value)
+
+    def traverse(self):
+        with self.lock.read_locked():
+            return list(self.linked_list)
+
+    def __len__(self):
+        with self.lock.read_locked():
+            return len(self.linked_list)
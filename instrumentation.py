@@ -0,0 +1,261 @@
+# Instrumentation
+# Opt-in counters for the work done by list operations: node dereferences
+# (following a next/prev/forward link), value comparisons and node
+# allocations. A list is only slowed down inside `with instrument(...)`;
+# outside it runs the plain classes from linked_list_classes.py.
+
+import inspect
+from array import array
+from contextlib import contextmanager
+
+from linked_list_classes import (
+    SinglyNode, DoublyNode, SkipListNode, UnrolledNode, SelfOrganizingNode,
+    ArenaLinkedList, XORLinkedList,
+)
+
+# Link attributes whose reads count as dereferences
+NODE_LINKS = {
+    SinglyNode: ('next',),
+    DoublyNode: ('next', 'prev'),
+    SkipListNode: ('forward',),
+    UnrolledNode: ('next', 'prev'),
+    SelfOrganizingNode: ('next',),
+}
+
+# Array-backed lists keep their links in these array attributes instead
+ARRAY_LINKS = {
+    ArenaLinkedList: ('next', 'prev'),
+    XORLinkedList: ('links',),
+}
+
+# Methods whose first argument is a value compared against the payloads
+VALUE_METHODS = ('search', 'delete_by_value', 'delete', '__contains__')
+
+COUNTERS = ('dereferences', 'comparisons', 'allocations')
+
+
+class OperationStats:
+    """Work counters for an instrumented list, in total and per method.
+
+    operations maps a method name to its call count and summed counters;
+    last holds (method name, counters) for the most recent call. Calls
+    made by another instrumented method are counted in the outer call only.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.dereferences = 0
+        self.comparisons = 0
+        self.allocations = 0
+        self.operations = {}
+        self.last = None
+        self._depth = 0
+
+    def counts(self):
+        return {name: getattr(self, name) for name in COUNTERS}
+
+    def per_call(self, name):
+        """Return the average counters per call of a method (zeros if never called)"""
+        totals = self.operations.get(name)
+        if not totals:
+            return dict.fromkeys(COUNTERS, 0.0)
+        return {counter: totals[counter] / totals['calls'] for counter in COUNTERS}
+
+    def _record(self, name, before):
+        counts = {counter: getattr(self, counter) - start for counter, start in zip(COUNTERS, before)}
+        totals = self.operations.setdefault(name, dict.fromkeys(('calls',) + COUNTERS, 0))
+        totals['calls'] += 1
+        for counter, value in counts.items():
+            totals[counter] += value
+        self.last = (name, counts)
+
+
+class _Probe:
+    """Stand-in for a looked-up value that counts each comparison made with it.
+
+    Payloads like ints, strings and tuples return NotImplemented when
+    compared with an unknown type, so Python falls back to the probe's
+    reflected method. A payload whose __eq__ returns False for foreign
+    types instead will not match the probe.
+    """
+    __slots__ = ('value', 'stats')
+
+    def __init__(self, value, stats):
+        self.value = value
+        self.stats = stats
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __eq__(self, other):
+        self.stats.comparisons += 1
+        return self.value == other
+
+    def __ne__(self, other):
+        self.stats.comparisons += 1
+        return self.value != other
+
+    def __lt__(self, other):
+        self.stats.comparisons += 1
+        return self.value < other
+
+    def __le__(self, other):
+        self.stats.comparisons += 1
+        return self.value <= other
+
+    def __gt__(self, other):
+        self.stats.comparisons += 1
+        return self.value > other
+
+    def __ge__(self, other):
+        self.stats.comparisons += 1
+        return self.value >= other
+
+
+def _lookup(table, cls):
+    for base in cls.__mro__:
+        if base in table:
+            return base, table[base]
+    return None, ()
+
+
+def _counting_node_class(node_class, stats):
+    # Same slot layout as node_class, so existing nodes can switch __class__
+    namespace = {'__slots__': ()}
+    for name in NODE_LINKS[node_class]:
+        slot = getattr(node_class, name)
+
+        def get_link(node, slot=slot):
+            stats.dereferences += 1
+            return slot.__get__(node)
+
+        namespace[name] = property(get_link, slot.__set__)
+
+    def __init__(self, *args):
+        stats.allocations += 1
+        node_class.__init__(self, *args)
+
+    namespace['__init__'] = __init__
+    return type(f"Counting{node_class.__name__}", (node_class,), namespace)
+
+
+class _CountingPool:
+    """Stands in for a list's attached NodePool while it is instrumented.
+
+    Acquired nodes are counted as allocations and switched to the counting
+    node class; released nodes are switched back before the real pool
+    takes them, so a pooled node never leaves the list still counting.
+    """
+    def __init__(self, pool, node_class, counting_node_class, stats):
+        self.pool = pool
+        self.node_class = node_class
+        self.counting_node_class = counting_node_class
+        self.stats = stats
+
+    def acquire(self, data):
+        self.stats.allocations += 1
+        node = self.pool(data)
+        node.__class__ = self.counting_node_class
+        return node
+
+    def release(self, node):
+        node.__class__ = self.node_class
+        self.pool.release(node)
+
+    def __getattr__(self, name):
+        return getattr(self.pool, name)
+
+
+def _counting_array_class(stats):
+    class CountingArray(array):
+        def __getitem__(self, index):
+            stats.dereferences += 1
+            return array.__getitem__(self, index)
+    return CountingArray
+
+
+def _counted_method(name, method, stats):
+    probe_value = name in VALUE_METHODS
+
+    def wrapper(self, *args, **kwargs):
+        if probe_value and args:
+            args = (_Probe(args[0], stats),) + args[1:]
+        before = (stats.dereferences, stats.comparisons, stats.allocations)
+        stats._depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            stats._depth -= 1
+            if not stats._depth:
+                stats._record(name, before)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+def _instrumented_class(cls, stats):
+    namespace = {'_instrumented': True}
+    for name in dir(cls):
+        if name.startswith('_') and name != '__contains__':
+            continue
+        method = inspect.getattr_static(cls, name)
+        # Skip classmethods, properties and generators (iter_range, ...), whose
+        # work happens after the call returns
+        if inspect.isfunction(method) and not inspect.isgeneratorfunction(method):
+            namespace[name] = _counted_method(name, method, stats)
+    node_class = getattr(cls, 'node_class', None)
+    if node_class is not None:
+        namespace['node_class'] = _counting_node_class(node_class, stats)
+    if _lookup(ARRAY_LINKS, cls)[0] is not None:
+        def _allocate(self, data):
+            stats.allocations += 1
+            return cls._allocate(self, data)
+        namespace['_allocate'] = _allocate
+    return type(f"Instrumented{cls.__name__}", (cls,), namespace)
+
+
+@contextmanager
+def instrument(linked_list, stats=None):
+    """Count the work done by linked_list's methods inside the with block.
+
+    Yields an OperationStats. The list and its nodes are switched to
+    counting subclasses on entry (an O(n) walk) and back on exit.
+    """
+    cls = type(linked_list)
+    if getattr(cls, '_instrumented', False):
+        raise ValueError("List is already being instrumented")
+    stats = stats if stats is not None else OperationStats()
+    instrumented = _instrumented_class(cls, stats)
+    node_class = getattr(cls, 'node_class', None)
+    counting_node_class = getattr(instrumented, 'node_class', None)
+    link_arrays = _lookup(ARRAY_LINKS, cls)[1]
+
+    for obj in linked_list._storage_objects():
+        if type(obj) is node_class:
+            obj.__class__ = counting_node_class
+    counting_array = _counting_array_class(stats)
+    for name in link_arrays:
+        links = getattr(linked_list, name)
+        setattr(linked_list, name, counting_array(links.typecode, links))
+    # attach_pool() sets node_class on the instance, which would hide the
+    # counting node class; route pool traffic through a counting stand-in
+    pool = linked_list.__dict__.get('pool')
+    if pool is not None:
+        counting_pool = _CountingPool(pool, node_class, counting_node_class, stats)
+        linked_list.pool = counting_pool
+        linked_list.node_class = counting_pool.acquire
+    linked_list.__class__ = instrumented
+    try:
+        yield stats
+    finally:
+        linked_list.__class__ = cls
+        if pool is not None:
+            linked_list.pool = pool
+            linked_list.node_class = pool
+        for name in link_arrays:
+            links = getattr(linked_list, name)
+            setattr(linked_list, name, array(links.typecode, links))
+        for obj in linked_list._storage_objects():
+            if type(obj) is counting_node_class:
+                obj.__class__ = node_class
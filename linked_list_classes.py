@@ -1,92 +1,495 @@
 # Linked List Classes
 # Extracted linked list implementations for better code organization
 
-class Node:
-    """Basic node class for linked lists"""
+import copy
+import gc
+import random
+import struct
+import sys
+import types
+from array import array
+
+class SinglyNode:
+    """Node for singly and circular linked lists (no prev pointer, no __dict__)"""
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+class DoublyNode:
+    """Node for doubly linked lists"""
+    __slots__ = ('data', 'next', 'prev')
+
     def __init__(self, data):
         self.data = data
         self.next = None
-        self.prev = None  # For doubly linked list
+        self.prev = None
+
+# Basic node class kept for code that builds node chains by hand
+Node = DoublyNode
+
+class NodePool:
+    """Free list of detached nodes that lists recycle instead of allocating.
+
+    Attach a pool to one list, or share it between lists that use the same
+    node class (not across threads). Released nodes are chained through
+    their next pointer, up to capacity; beyond that they are left to the
+    garbage collector. CPython already recycles small objects cheaply, so
+    check `python benchmarks.py node_pool` before counting on a speedup.
+    """
+    def __init__(self, node_class=SinglyNode, capacity=1024):
+        if node_class not in (SinglyNode, DoublyNode):
+            raise ValueError("NodePool supports SinglyNode and DoublyNode")
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        self.node_class = node_class
+        self.capacity = capacity
+        self.free = None
+        self.free_count = 0
+        self._has_prev = node_class is DoublyNode
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.allocations = 0  # Nodes created because the pool was empty
+        self.reuses = 0
+        self.releases = 0
+        self.drops = 0  # Nodes released while the pool was full
+
+    @property
+    def hit_rate(self):
+        requests = self.allocations + self.reuses
+        return self.reuses / requests if requests else 0.0
+
+    def __call__(self, data):
+        # Lists call the pool in place of their node class
+        node = self.free
+        if node is None:
+            self.allocations += 1
+            return self.node_class(data)
+        self.free = node.next
+        self.free_count -= 1
+        self.reuses += 1
+        node.data = data
+        node.next = None
+        return node
+
+    def release(self, node):
+        """Take back a node that is no longer linked into any list"""
+        if self.free_count >= self.capacity:
+            self.drops += 1
+            return
+        node.data = None  # Don't keep the payload alive
+        if self._has_prev:
+            node.prev = None
+        node.next = self.free
+        self.free = node
+        self.free_count += 1
+        self.releases += 1
+
+    def clear(self):
+        self.free = None
+        self.free_count = 0
+
+    def __len__(self):
+        return self.free_count
+
+def _split_chain(head, count):
+    # Cut the chain after count nodes and return the remainder
+    for i in range(count - 1):
+        if head is None:
+            return None
+        head = head.next
+    if head is None:
+        return None
+    rest = head.next
+    head.next = None
+    return rest
+
+def _merge_chains(left, right, key, reverse):
+    # Stable merge of two non-empty chains; returns (first, last)
+    dummy = last = SinglyNode(None)
+    left_key, right_key = key(left.data), key(right.data)
+    while True:
+        if (right_key > left_key) if reverse else (right_key < left_key):
+            last.next = last = right
+            right = right.next
+            if right is None:
+                last.next = left
+                break
+            right_key = key(right.data)
+        else:
+            last.next = last = left
+            left = left.next
+            if left is None:
+                last.next = right
+                break
+            left_key = key(left.data)
+    while last.next is not None:
+        last = last.next
+    return dummy.next, last
+
+def _sort_chain(head, count, key=None, reverse=False):
+    """Bottom-up merge sort of a None-terminated chain; returns (first, last).
+
+    Relinks the existing nodes using only next pointers, so it needs O(1)
+    extra space and no recursion. Equal keys keep their original order.
+    """
+    if key is None:
+        key = _identity
+    dummy = SinglyNode(None)
+    dummy.next = head
+    last = head
+    width = 1
+    while width < count:
+        tail = dummy
+        current = dummy.next
+        while current is not None:
+            left = current
+            right = _split_chain(left, width)
+            current = _split_chain(right, width)
+            if right is None:
+                tail.next = left
+                last = left
+                while last.next is not None:
+                    last = last.next
+                break
+            tail.next, last = _merge_chains(left, right, key, reverse)
+            tail = last
+        width *= 2
+    return dummy.next, last
+
+def _identity(data):
+    return data
+
+def _rebuild_list(cls, values, options):
+    # Module-level so pickle can find it by name
+    return cls.from_iterable(values, **options) if options else cls.from_iterable(values)
+
+_DUMP_MAGIC = b'LLD1'
+_DUMP_HEADER = struct.Struct('<4scQ')  # magic, array typecode, element count
+
+class _FlatSerializationMixin:
+    """Pickle, copy and binary dump support that never recurses through nodes.
+
+    A list is flattened to a plain Python list of its values and rebuilt
+    with from_iterable in one linking pass, so a 1M-node list pickles as
+    easily as a 1M-element list. Subclasses describe their constructor
+    arguments in _pickle_options() and any extra state (counters, RNG) in
+    __getstate__/__setstate__.
+    """
+    def _pickle_options(self):
+        return {}
+
+    def __getstate__(self):
+        return None
+
+    def __setstate__(self, state):
+        pass
 
-class SinglyLinkedList:
+    def __reduce__(self):
+        state = self.__getstate__()
+        args = (type(self), list(self), self._pickle_options())
+        return (_rebuild_list, args) if state is None else (_rebuild_list, args, state)
+
+    def _rebuild(self, values):
+        linked_list = _rebuild_list(type(self), values, self._pickle_options())
+        state = self.__getstate__()
+        if state is not None:
+            linked_list.__setstate__(copy.deepcopy(state))
+        return linked_list
+
+    def __copy__(self):
+        return self._rebuild(list(self))
+
+    def __deepcopy__(self, memo):
+        linked_list = self._rebuild(copy.deepcopy(list(self), memo))
+        memo[id(self)] = linked_list
+        return linked_list
+
+    def dump(self, file, typecode=None):
+        """Write int/float values to a binary file as a packed array.
+
+        typecode is any array module code; by default 'q' (int64) is used
+        for integers and 'd' (float64) otherwise. Raises TypeError for
+        non-numeric values and ValueError for a value the typecode can't
+        hold (such as an int of 2**63 or more). bools are stored as ints
+        and load back as 0 and 1.
+        """
+        code = typecode or 'q'
+        try:
+            if typecode is None:
+                try:
+                    values = array(code, self)
+                except TypeError:
+                    code = 'd'
+                    values = array(code, self)
+            else:
+                values = array(code, self)
+        except OverflowError:
+            for value in self:
+                try:
+                    array(code, [value])
+                except OverflowError:
+                    raise ValueError(f"Value {value!r} does not fit typecode '{code}'") from None
+            raise
+        file.write(_DUMP_HEADER.pack(_DUMP_MAGIC, values.typecode.encode(), len(values)))
+        if sys.byteorder == 'big':  # The format is little-endian
+            values.byteswap()
+        file.write(values.tobytes())
+
+    @classmethod
+    def load(cls, file, **options):
+        """Build a list from a file written by dump()"""
+        header = file.read(_DUMP_HEADER.size)
+        if len(header) != _DUMP_HEADER.size:
+            raise ValueError("Truncated linked list dump")
+        magic, typecode, count = _DUMP_HEADER.unpack(header)
+        if magic != _DUMP_MAGIC:
+            raise ValueError("Not a linked list dump")
+        values = array(typecode.decode())
+        data = file.read(count * values.itemsize)
+        if len(data) != count * values.itemsize:
+            raise ValueError("Truncated linked list dump")
+        values.frombytes(data)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return _rebuild_list(cls, values.tolist(), options)
+
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+def payload_size(values, deep=True, seen=None):
+    """Return the bytes used by distinct objects in values.
+
+    With deep=True the objects they reference (list items, instance dicts,
+    ...) are counted too, walking with an explicit stack. Objects whose id
+    is in seen are skipped, and every counted id is added to it.
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = list(values)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if deep:
+            stack.extend(gc.get_referents(obj))
+    return total
+
+class _MemoryUsageMixin:
+    """memory_usage() for list classes.
+
+    Subclasses implement _storage_objects() to yield every object the list
+    allocates besides itself: nodes, link arrays, index dicts.
+    """
+    def memory_usage(self, deep=True):
+        """Return bytes used by the list, broken down by component.
+
+        nodes: node objects or slot arrays plus their per-node link lists;
+        dicts: lookup tables such as a value index; payloads: the stored
+        values (and what they reference when deep is True); container: the
+        list object and its attribute dict.
+        """
+        seen = {id(self), id(self.__dict__)}
+        usage = {"nodes": 0, "dicts": 0, "payloads": 0,
+                 "container": sys.getsizeof(self) + sys.getsizeof(self.__dict__)}
+        for obj in self._storage_objects():
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                usage["dicts" if type(obj) is dict else "nodes"] += sys.getsizeof(obj)
+        usage["payloads"] = payload_size(self, deep, seen)
+        usage["total"] = sum(usage.values())
+        return usage
+
+class _NodePoolMixin:
+    """attach_pool() support for lists whose deletes hand nodes back to self.pool"""
+    pool = None
+
+    def attach_pool(self, pool):
+        """Allocate nodes from pool and release deleted nodes back to it"""
+        if pool.node_class is not type(self).node_class:
+            raise ValueError(f"{type(self).__name__} needs a pool of {type(self).node_class.__name__}")
+        self.pool = pool
+        self.node_class = pool
+
+    def detach_pool(self):
+        self.__dict__.pop('pool', None)
+        self.__dict__.pop('node_class', None)
+
+class SinglyLinkedList(_FlatSerializationMixin, _MemoryUsageMixin, _NodePoolMixin):
     """Singly linked list implementation"""
+    node_class = SinglyNode
+
     def __init__(self):
         self.head = None
+        self.tail = None  # Last node, so appends don't walk the list
         self.size = 0
+        self._finger = None  # (index, node) of the last positional access
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list from any iterable in a single linking pass"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _storage_objects(self):
+        current = self.head
+        while current:
+            yield current
+            current = current.next
 
     def insert_at_beginning(self, data):
-        new_node = Node(data)
+        new_node = self.node_class(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._finger = None
         self.size += 1
 
     def insert_at_end(self, data):
-        new_node = Node(data)
-        if self.head is None:
-            self.head = new_node
+        new_node = self.node_class(data)
+        if self.tail is None:
+            self.head = self.tail = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+            self.tail = new_node
         self.size += 1
 
+    def _build_chain(self, iterable):
+        # Link the values behind a dummy node; returns (first, last, count)
+        node_class = self.node_class
+        # The dummy comes from the class's own node type, not an attached pool
+        dummy = last = type(self).node_class(None)
+        count = 0
+        for data in iterable:
+            last.next = last = node_class(data)
+            count += 1
+        return dummy.next, last, count
+
+    def extend(self, iterable):
+        """Append every value from iterable, in order"""
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+
+    def extend_left(self, iterable):
+        """Prepend every value from iterable, keeping the iterable's order"""
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+        last.next = self.head
+        if self.tail is None:
+            self.tail = last
+        self.head = first
+        self._finger = None
+        self.size += count
+
     def insert_at_index(self, data, index):
         if index < 0 or index > self.size:
             return False
         if index == 0:
             self.insert_at_beginning(data)
             return True
-        new_node = Node(data)
-        current = self.head
-        for i in range(index - 1):
-            if current is None:
-                return False
-            current = current.next
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        new_node = self.node_class(data)
+        current = self._node_at(index - 1)
         new_node.next = current.next
         current.next = new_node
+        self._finger = (index, new_node)
         self.size += 1
         return True
 
+    def _node_at(self, index):
+        # Walk from the finger when it is at or before index, otherwise from head
+        if index == self.size - 1:
+            return self.tail
+        finger = self._finger
+        if finger is not None and finger[0] <= index:
+            position, current = finger
+        else:
+            position, current = 0, self.head
+        for i in range(index - position):
+            current = current.next
+        self._finger = (index, current)
+        return current
+
+    def get(self, index):
+        """Return the value at index, or None if index is out of range"""
+        if index < 0 or index >= self.size:
+            return None
+        return self._node_at(index).data
+
     def delete_from_beginning(self):
         if self.head is None:
             return None
-        deleted_data = self.head.data
-        self.head = self.head.next
+        deleted = self.head
+        self.head = deleted.next
+        if self.head is None:
+            self.tail = None
+        self._finger = None
         self.size -= 1
+        deleted_data = deleted.data
+        if self.pool is not None:
+            self.pool.release(deleted)
         return deleted_data
 
     def delete_from_end(self):
         if self.head is None:
             return None
+        if self._finger is not None and self._finger[0] == self.size - 1:
+            self._finger = None
         if self.head.next is None:
-            deleted_data = self.head.data
-            self.head = None
-            self.size -= 1
-            return deleted_data
-        current = self.head
-        while current.next.next:
-            current = current.next
-        deleted_data = current.next.data
-        current.next = None
+            deleted = self.head
+            self.head = self.tail = None
+        else:
+            current = self.head
+            while current.next.next:
+                current = current.next
+            deleted = current.next
+            current.next = None
+            self.tail = current
         self.size -= 1
+        deleted_data = deleted.data
+        if self.pool is not None:
+            self.pool.release(deleted)
         return deleted_data
 
     def delete_by_value(self, value):
         if self.head is None:
             return False
+        self._finger = None
         if self.head.data == value:
-            self.head = self.head.next
-            self.size -= 1
-            return True
-        current = self.head
-        while current.next and current.next.data != value:
-            current = current.next
-        if current.next:
-            current.next = current.next.next
-            self.size -= 1
-            return True
-        return False
+            deleted = self.head
+            self.head = deleted.next
+            if self.head is None:
+                self.tail = None
+        else:
+            current = self.head
+            while current.next and current.next.data != value:
+                current = current.next
+            deleted = current.next
+            if deleted is None:
+                return False
+            if deleted is self.tail:
+                self.tail = current
+            current.next = deleted.next
+        self.size -= 1
+        if self.pool is not None:
+            self.pool.release(deleted)
+        return True
 
     def search(self, value):
         current = self.head
@@ -98,6 +501,11 @@ class SinglyLinkedList:
             position += 1
         return -1
 
+    def sort(self, key=None, reverse=False):
+        """Stable in-place merge sort that relinks the existing nodes"""
+        self.head, self.tail = _sort_chain(self.head, self.size, key, reverse)
+        self._finger = None
+
     def traverse(self):
         elements = []
         current = self.head
@@ -106,25 +514,67 @@ class SinglyLinkedList:
             current = current.next
         return elements
 
-class DoublyLinkedList:
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        # Without prev pointers the values have to be buffered once
+        return reversed(self.traverse())
+
+    def iter_range(self, start, stop=None):
+        """Yield the values at positions start <= i < stop without copying the list"""
+        stop = self.size if stop is None else min(stop, self.size)
+        start = max(start, 0)
+        if start >= stop:
+            return
+        current = self._node_at(start)
+        for i in range(stop - start):
+            yield current.data
+            current = current.next
+
+
+class DoublyLinkedList(_FlatSerializationMixin, _MemoryUsageMixin, _NodePoolMixin):
     """Doubly linked list implementation"""
+    node_class = DoublyNode
+
     def __init__(self):
         self.head = None
         self.tail = None
         self.size = 0
+        self._finger = None  # (index, node) of the last positional access
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list from any iterable in a single linking pass"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _storage_objects(self):
+        current = self.head
+        while current:
+            yield current
+            current = current.next
 
     def insert_at_beginning(self, data):
-        new_node = Node(data)
+        new_node = self.node_class(data)
         if self.head is None:
             self.head = self.tail = new_node
         else:
             new_node.next = self.head
             self.head.prev = new_node
             self.head = new_node
+        self._finger = None
         self.size += 1
 
     def insert_at_end(self, data):
-        new_node = Node(data)
+        new_node = self.node_class(data)
         if self.tail is None:
             self.head = self.tail = new_node
         else:
@@ -133,6 +583,49 @@ class DoublyLinkedList:
             self.tail = new_node
         self.size += 1
 
+    def _build_chain(self, iterable):
+        # Link the values behind a dummy node; returns (first, last, count)
+        node_class = self.node_class
+        # The dummy comes from the class's own node type, not an attached pool
+        dummy = last = type(self).node_class(None)
+        count = 0
+        for data in iterable:
+            node = node_class(data)
+            node.prev = last
+            last.next = last = node
+            count += 1
+        first = dummy.next
+        if first is not None:
+            first.prev = None
+        return first, last, count
+
+    def extend(self, iterable):
+        """Append every value from iterable, in order"""
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        self.tail = last
+        self.size += count
+
+    def extend_left(self, iterable):
+        """Prepend every value from iterable, keeping the iterable's order"""
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+        if self.head is None:
+            self.tail = last
+        else:
+            last.next = self.head
+            self.head.prev = last
+        self.head = first
+        self._finger = None
+        self.size += count
+
     def insert_at_index(self, data, index):
         if index < 0 or index > self.size:
             return False
@@ -142,42 +635,74 @@ class DoublyLinkedList:
         if index == self.size:
             self.insert_at_end(data)
             return True
-        new_node = Node(data)
-        current = self.head
-        for i in range(index):
-            current = current.next
+        new_node = self.node_class(data)
+        current = self._node_at(index)
         new_node.prev = current.prev
         new_node.next = current
         current.prev.next = new_node
         current.prev = new_node
+        self._finger = (index, new_node)
         self.size += 1
         return True
 
+    def _node_at(self, index):
+        # Walk from whichever of head, tail or the finger is closest to index
+        position, current = 0, self.head
+        if self.size - 1 - index < index:
+            position, current = self.size - 1, self.tail
+        finger = self._finger
+        if finger is not None and abs(finger[0] - index) < abs(position - index):
+            position, current = finger
+        if position <= index:
+            for i in range(index - position):
+                current = current.next
+        else:
+            for i in range(position - index):
+                current = current.prev
+        self._finger = (index, current)
+        return current
+
+    def get(self, index):
+        """Return the value at index, or None if index is out of range"""
+        if index < 0 or index >= self.size:
+            return None
+        return self._node_at(index).data
+
     def delete_from_beginning(self):
         if self.head is None:
             return None
-        deleted_data = self.head.data
-        if self.head == self.tail:
+        deleted = self.head
+        if deleted is self.tail:
             self.head = self.tail = None
         else:
-            self.head = self.head.next
+            self.head = deleted.next
             self.head.prev = None
+        self._finger = None
         self.size -= 1
+        deleted_data = deleted.data
+        if self.pool is not None:
+            self.pool.release(deleted)
         return deleted_data
 
     def delete_from_end(self):
         if self.tail is None:
             return None
-        deleted_data = self.tail.data
-        if self.head == self.tail:
+        deleted = self.tail
+        if self._finger is not None and self._finger[0] == self.size - 1:
+            self._finger = None
+        if self.head is deleted:
             self.head = self.tail = None
         else:
-            self.tail = self.tail.prev
+            self.tail = deleted.prev
             self.tail.next = None
         self.size -= 1
+        deleted_data = deleted.data
+        if self.pool is not None:
+            self.pool.release(deleted)
         return deleted_data
 
     def delete_by_value(self, value):
+        self._finger = None
         current = self.head
         while current:
             if current.data == value:
@@ -190,10 +715,43 @@ class DoublyLinkedList:
                 else:
                     self.tail = current.prev
                 self.size -= 1
+                if self.pool is not None:
+                    self.pool.release(current)
                 return True
             current = current.next
         return False
 
+    def insert_after(self, node, data):
+        """Insert data right after node of this list in O(1); return the new node"""
+        new_node = self.node_class(data)
+        new_node.prev = node
+        new_node.next = node.next
+        if node.next is None:
+            self.tail = new_node
+        else:
+            node.next.prev = new_node
+        node.next = new_node
+        self._finger = None
+        self.size += 1
+        return new_node
+
+    def remove_node(self, node):
+        """Unlink a node of this list in O(1) and return its data"""
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        self._finger = None
+        self.size -= 1
+        data = node.data
+        if self.pool is not None:
+            self.pool.release(node)
+        return data
+
     def search(self, value):
         current = self.head
         position = 0
@@ -204,6 +762,16 @@ class DoublyLinkedList:
             position += 1
         return -1
 
+    def sort(self, key=None, reverse=False):
+        """Stable in-place merge sort that relinks the existing nodes"""
+        self.head, self.tail = _sort_chain(self.head, self.size, key, reverse)
+        prev_node = None
+        current = self.head
+        while current:
+            current.prev = prev_node
+            prev_node, current = current, current.next
+        self._finger = None
+
     def traverse_forward(self):
         elements = []
         current = self.head
@@ -220,108 +788,225 @@ class DoublyLinkedList:
             current = current.prev
         return elements
 
-class CircularLinkedList:
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+
+    def iter_range(self, start, stop=None):
+        """Yield the values at positions start <= i < stop without copying the list"""
+        stop = self.size if stop is None else min(stop, self.size)
+        start = max(start, 0)
+        if start >= stop:
+            return
+        current = self._node_at(start)
+        for i in range(stop - start):
+            yield current.data
+            current = current.next
+
+
+class CircularLinkedList(_FlatSerializationMixin, _MemoryUsageMixin, _NodePoolMixin):
     """Circular linked list implementation"""
+    node_class = SinglyNode
+
     def __init__(self):
         self.head = None
+        self.tail = None  # tail.next is always head, so both ends are O(1)
         self.size = 0
+        self._finger = None  # (index, node) of the last positional access
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list from any iterable in a single linking pass"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _storage_objects(self):
+        current = self.head
+        for i in range(self.size):
+            yield current
+            current = current.next
 
     def insert_at_beginning(self, data):
-        new_node = Node(data)
+        new_node = self.node_class(data)
         if self.head is None:
             new_node.next = new_node
-            self.head = new_node
+            self.head = self.tail = new_node
         else:
             new_node.next = self.head
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
             self.head = new_node
+        self._finger = None
         self.size += 1
 
     def insert_at_end(self, data):
-        new_node = Node(data)
+        new_node = self.node_class(data)
         if self.head is None:
             new_node.next = new_node
-            self.head = new_node
+            self.head = self.tail = new_node
         else:
             new_node.next = self.head
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+            self.tail = new_node
         self.size += 1
 
+    def _build_chain(self, iterable):
+        # Link the values behind a dummy node; returns (first, last, count)
+        node_class = self.node_class
+        # The dummy comes from the class's own node type, not an attached pool
+        dummy = last = type(self).node_class(None)
+        count = 0
+        for data in iterable:
+            last.next = last = node_class(data)
+            count += 1
+        return dummy.next, last, count
+
+    def extend(self, iterable):
+        """Append every value from iterable, in order"""
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        last.next = self.head
+        self.tail = last
+        self.size += count
+
+    def extend_left(self, iterable):
+        """Prepend every value from iterable, keeping the iterable's order"""
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+        if self.head is None:
+            self.tail = last
+        else:
+            last.next = self.head
+        self.tail.next = first
+        self.head = first
+        self._finger = None
+        self.size += count
+
     def insert_at_index(self, data, index):
         if index < 0 or index > self.size:
             return False
         if index == 0:
             self.insert_at_beginning(data)
             return True
-        new_node = Node(data)
-        current = self.head
-        for i in range(index - 1):
-            current = current.next
-            if current == self.head:
-                return False
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        new_node = self.node_class(data)
+        current = self._node_at(index - 1)
         new_node.next = current.next
         current.next = new_node
+        self._finger = (index, new_node)
         self.size += 1
         return True
 
+    def _node_at(self, index):
+        # Walk from the finger when it is at or before index, otherwise from head
+        if index == self.size - 1:
+            return self.tail
+        finger = self._finger
+        if finger is not None and finger[0] <= index:
+            position, current = finger
+        else:
+            position, current = 0, self.head
+        for i in range(index - position):
+            current = current.next
+        self._finger = (index, current)
+        return current
+
+    def get(self, index):
+        """Return the value at index, or None if index is out of range"""
+        if index < 0 or index >= self.size:
+            return None
+        return self._node_at(index).data
+
     def delete_from_beginning(self):
         if self.head is None:
             return None
-        deleted_data = self.head.data
-        if self.head.next == self.head:
-            self.head = None
+        deleted = self.head
+        if deleted is self.tail:
+            self.head = self.tail = None
         else:
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = self.head.next
-            self.head = self.head.next
+            self.head = deleted.next
+            self.tail.next = self.head
+        self._finger = None
         self.size -= 1
+        deleted_data = deleted.data
+        if self.pool is not None:
+            self.pool.release(deleted)
         return deleted_data
 
     def delete_from_end(self):
         if self.head is None:
             return None
-        deleted_data = self.head.data
-        if self.head.next == self.head:
-            self.head = None
+        if self._finger is not None and self._finger[0] == self.size - 1:
+            self._finger = None
+        deleted = self.tail
+        if self.head is deleted:
+            self.head = self.tail = None
         else:
             current = self.head
-            while current.next.next != self.head:
+            while current.next is not deleted:
                 current = current.next
-            deleted_data = current.next.data
             current.next = self.head
+            self.tail = current
         self.size -= 1
+        deleted_data = deleted.data
+        if self.pool is not None:
+            self.pool.release(deleted)
         return deleted_data
 
     def delete_by_value(self, value):
         if self.head is None:
             return False
+        self._finger = None
         if self.head.data == value:
-            if self.head.next == self.head:
-                self.head = None
-            else:
-                current = self.head
-                while current.next != self.head:
-                    current = current.next
-                current.next = self.head.next
-                self.head = self.head.next
-            self.size -= 1
+            self.delete_from_beginning()
             return True
         current = self.head
-        while current.next != self.head and current.next.data != value:
+        while current.next is not self.head and current.next.data != value:
             current = current.next
-        if current.next != self.head:
-            current.next = current.next.next
-            self.size -= 1
-            return True
-        return False
+        deleted = current.next
+        if deleted is self.head:
+            return False
+        if deleted is self.tail:
+            self.tail = current
+        current.next = deleted.next
+        self.size -= 1
+        if self.pool is not None:
+            self.pool.release(deleted)
+        return True
+
+    def rotate(self, steps=1):
+        """Advance the head by steps nodes; the old head moves to the back.
+
+        O(1) per step: only head and tail move, no node is relinked. Like
+        deque.rotate(-steps).
+        """
+        if self.head is None:
+            return
+        steps %= self.size
+        if steps:
+            self._finger = None
+        for i in range(steps):
+            self.tail = self.head
+            self.head = self.head.next
 
     def search(self, value):
         if self.head is None:
@@ -337,6 +1022,15 @@ class CircularLinkedList:
                 break
         return -1
 
+    def sort(self, key=None, reverse=False):
+        """Stable in-place merge sort that relinks the existing nodes"""
+        if self.head is None:
+            return
+        self.tail.next = None  # Open the ring so the chain has an end
+        self.head, self.tail = _sort_chain(self.head, self.size, key, reverse)
+        self.tail.next = self.head
+        self._finger = None
+
     def traverse(self, max_elements=None):
         if self.head is None:
             return []
@@ -350,3 +1044,1431 @@ class CircularLinkedList:
             if current == self.head:
                 break
         return elements
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        # One lap around the ring, starting at head
+        current = self.head
+        for i in range(self.size):
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        # Without prev pointers the values have to be buffered once
+        return reversed(self.traverse())
+
+    def iter_range(self, start, stop=None):
+        """Yield the values at positions start <= i < stop without copying the list"""
+        stop = self.size if stop is None else min(stop, self.size)
+        start = max(start, 0)
+        if start >= stop:
+            return
+        current = self._node_at(start)
+        for i in range(stop - start):
+            yield current.data
+            current = current.next
+
+
+class ArenaLinkedList(_FlatSerializationMixin, _MemoryUsageMixin):
+    """Doubly linked list stored as parallel arrays instead of Node objects.
+
+    Slot i holds values[i] with links next[i] and prev[i]; NIL (-1) marks
+    the end of a chain. Deleted slots are threaded onto a free list through
+    the next array and reused by later inserts.
+    """
+    NIL = -1
+
+    def __init__(self):
+        self.values = []
+        self.next = array('q')
+        self.prev = array('q')
+        self.head = self.NIL
+        self.tail = self.NIL
+        self.free = self.NIL
+        self.size = 0
+        self._finger = None  # (index, slot) of the last positional access
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list from any iterable in a single linking pass"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _storage_objects(self):
+        return iter((self.values, self.next, self.prev))
+
+    def _allocate(self, data):
+        if self.free != self.NIL:
+            slot = self.free
+            self.free = self.next[slot]
+            self.values[slot] = data
+        else:
+            slot = len(self.values)
+            self.values.append(data)
+            self.next.append(self.NIL)
+            self.prev.append(self.NIL)
+        return slot
+
+    def _release(self, slot):
+        data = self.values[slot]
+        self.values[slot] = None
+        self.prev[slot] = self.NIL
+        self.next[slot] = self.free
+        self.free = slot
+        return data
+
+    def _slot_at(self, index):
+        # Walk from whichever of head, tail or the finger is closest to index
+        position, slot = 0, self.head
+        if self.size - 1 - index < index:
+            position, slot = self.size - 1, self.tail
+        finger = self._finger
+        if finger is not None and abs(finger[0] - index) < abs(position - index):
+            position, slot = finger
+        if position <= index:
+            for i in range(index - position):
+                slot = self.next[slot]
+        else:
+            for i in range(position - index):
+                slot = self.prev[slot]
+        self._finger = (index, slot)
+        return slot
+
+    def get(self, index):
+        """Return the value at index, or None if index is out of range"""
+        if index < 0 or index >= self.size:
+            return None
+        return self.values[self._slot_at(index)]
+
+    def _unlink(self, slot):
+        self._finger = None
+        prev_slot, next_slot = self.prev[slot], self.next[slot]
+        if prev_slot == self.NIL:
+            self.head = next_slot
+        else:
+            self.next[prev_slot] = next_slot
+        if next_slot == self.NIL:
+            self.tail = prev_slot
+        else:
+            self.prev[next_slot] = prev_slot
+        self.size -= 1
+        return self._release(slot)
+
+    def insert_at_beginning(self, data):
+        slot = self._allocate(data)
+        self.prev[slot] = self.NIL
+        self.next[slot] = self.head
+        if self.head == self.NIL:
+            self.tail = slot
+        else:
+            self.prev[self.head] = slot
+        self.head = slot
+        self._finger = None
+        self.size += 1
+
+    def insert_at_end(self, data):
+        slot = self._allocate(data)
+        self.next[slot] = self.NIL
+        self.prev[slot] = self.tail
+        if self.tail == self.NIL:
+            self.head = slot
+        else:
+            self.next[self.tail] = slot
+        self.tail = slot
+        self.size += 1
+
+    def extend(self, iterable):
+        """Append every value from iterable, in order"""
+        next_links, prev_links = self.next, self.prev
+        last = self.tail
+        count = 0
+        for data in iterable:
+            slot = self._allocate(data)
+            prev_links[slot] = last
+            next_links[slot] = self.NIL
+            if last == self.NIL:
+                self.head = slot
+            else:
+                next_links[last] = slot
+            last = slot
+            count += 1
+        self.tail = last
+        self.size += count
+
+    def extend_left(self, iterable):
+        """Prepend every value from iterable, keeping the iterable's order"""
+        next_links, prev_links = self.next, self.prev
+        first = last = self.NIL
+        count = 0
+        for data in iterable:
+            slot = self._allocate(data)
+            prev_links[slot] = last
+            if last == self.NIL:
+                first = slot
+            else:
+                next_links[last] = slot
+            last = slot
+            count += 1
+        if count == 0:
+            return
+        next_links[last] = self.head
+        if self.head == self.NIL:
+            self.tail = last
+        else:
+            prev_links[self.head] = last
+        self.head = first
+        self._finger = None
+        self.size += count
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == 0:
+            self.insert_at_beginning(data)
+            return True
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        current = self._slot_at(index)
+        slot = self._allocate(data)
+        prev_slot = self.prev[current]
+        self.prev[slot] = prev_slot
+        self.next[slot] = current
+        self.next[prev_slot] = slot
+        self.prev[current] = slot
+        self._finger = (index, slot)
+        self.size += 1
+        return True
+
+    def delete_from_beginning(self):
+        if self.head == self.NIL:
+            return None
+        return self._unlink(self.head)
+
+    def delete_from_end(self):
+        if self.tail == self.NIL:
+            return None
+        return self._unlink(self.tail)
+
+    def delete_by_value(self, value):
+        slot = self.head
+        while slot != self.NIL:
+            if self.values[slot] == value:
+                self._unlink(slot)
+                return True
+            slot = self.next[slot]
+        return False
+
+    def search(self, value):
+        slot = self.head
+        position = 0
+        while slot != self.NIL:
+            if self.values[slot] == value:
+                return position
+            slot = self.next[slot]
+            position += 1
+        return -1
+
+    def traverse(self):
+        values, next_links = self.values, self.next
+        elements = []
+        slot = self.head
+        while slot != self.NIL:
+            elements.append(values[slot])
+            slot = next_links[slot]
+        return elements
+
+    traverse_forward = traverse
+
+    def traverse_backward(self):
+        values, prev_links = self.values, self.prev
+        elements = []
+        slot = self.tail
+        while slot != self.NIL:
+            elements.append(values[slot])
+            slot = prev_links[slot]
+        return elements
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        values, next_links = self.values, self.next
+        slot = self.head
+        while slot != self.NIL:
+            yield values[slot]
+            slot = next_links[slot]
+
+    def __reversed__(self):
+        values, prev_links = self.values, self.prev
+        slot = self.tail
+        while slot != self.NIL:
+            yield values[slot]
+            slot = prev_links[slot]
+
+    def iter_range(self, start, stop=None):
+        """Yield the values at positions start <= i < stop without copying the list"""
+        stop = self.size if stop is None else min(stop, self.size)
+        start = max(start, 0)
+        if start >= stop:
+            return
+        slot = self._slot_at(start)
+        for i in range(stop - start):
+            yield self.values[slot]
+            slot = self.next[slot]
+
+class _ValueIndexMixin:
+    """Value -> node map shared by the indexed list variants.
+
+    A value held by one node maps straight to that node; only a duplicate
+    value switches its entry to an insertion-ordered dict of nodes (and
+    back once one node is left), so membership is a dict lookup and a node
+    can be found without a scan. Values must be hashable.
+    """
+    def __init__(self):
+        super().__init__()
+        self._index = {}
+
+    def _storage_objects(self):
+        yield from super()._storage_objects()
+        yield self._index
+        for entry in self._index.values():
+            if type(entry) is dict:
+                yield entry
+
+    def _index_add(self, node):
+        data = node.data
+        entry = self._index.get(data)
+        if entry is None:
+            self._index[data] = node
+        elif type(entry) is dict:
+            entry[node] = None
+        else:
+            self._index[data] = {entry: None, node: None}
+
+    def _index_discard(self, node, data):
+        entry = self._index[data]
+        if type(entry) is not dict:
+            del self._index[data]
+            return
+        del entry[node]
+        if len(entry) == 1:
+            self._index[data] = next(iter(entry))
+
+    def _first_node_with(self, value):
+        # With duplicates the dict order is not list order, so find the first one by identity
+        entry = self._index.get(value)
+        if entry is None or type(entry) is not dict:
+            return entry
+        current = self.head
+        while current not in entry:
+            current = current.next
+        return current
+
+    def __contains__(self, value):
+        return value in self._index
+
+    def search(self, value):
+        # Misses are O(1); a hit still walks to report the position
+        node = self._first_node_with(value)
+        if node is None:
+            return -1
+        current = self.head
+        position = 0
+        while current is not node:
+            current = current.next
+            position += 1
+        return position
+
+class _PredecessorMapMixin:
+    """Node -> predecessor map for the indexed singly and circular lists.
+
+    Knowing each node's predecessor lets _unlink() remove any node in O(1)
+    on average, so delete_by_value and delete_from_end need no walk, at
+    the cost of a dict update or two per insert. The head's predecessor is
+    stored as None. Classes supply _unlink(), which maintains the map.
+    """
+    def __init__(self):
+        super().__init__()
+        self._prev = {}
+
+    def _storage_objects(self):
+        yield from super()._storage_objects()
+        yield self._prev
+
+    def insert_at_beginning(self, data):
+        old_head = self.head
+        super().insert_at_beginning(data)
+        self._prev[self.head] = None
+        if old_head is not None:
+            self._prev[old_head] = self.head
+        self._index_add(self.head)
+
+    def insert_at_end(self, data):
+        old_tail = self.tail
+        super().insert_at_end(data)
+        self._prev[self.tail] = old_tail
+        self._index_add(self.tail)
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == 0:
+            self.insert_at_beginning(data)
+            return True
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        prev_node = self._node_at(index - 1)
+        new_node = self.node_class(data)
+        new_node.next = prev_node.next
+        prev_node.next = new_node
+        self._finger = (index, new_node)
+        self._prev[new_node] = prev_node
+        self._prev[new_node.next] = new_node
+        self._index_add(new_node)
+        self.size += 1
+        return True
+
+    def _rebuild_prev(self):
+        # Rebuild the predecessor map after nodes were relinked
+        prev_node = None
+        current = self.head
+        for i in range(self.size):
+            self._prev[current] = prev_node
+            prev_node, current = current, current.next
+
+    def _index_chain(self, first, count, prev_node):
+        # Register count freshly linked nodes starting at first; returns the last one
+        current = first
+        for i in range(count):
+            self._prev[current] = prev_node
+            self._index_add(current)
+            prev_node = current
+            current = current.next
+        return prev_node
+
+    def extend(self, iterable):
+        old_tail, old_size = self.tail, self.size
+        super().extend(iterable)
+        first = self.head if old_tail is None else old_tail.next
+        self._index_chain(first, self.size - old_size, old_tail)
+
+    def extend_left(self, iterable):
+        old_head, old_size = self.head, self.size
+        super().extend_left(iterable)
+        last = self._index_chain(self.head, self.size - old_size, None)
+        if old_head is not None:
+            self._prev[old_head] = last
+
+    def sort(self, key=None, reverse=False):
+        super().sort(key, reverse)
+        self._prev.clear()
+        self._rebuild_prev()
+
+    def delete_from_beginning(self):
+        if self.head is None:
+            return None
+        return self._unlink(self.head)
+
+    def delete_from_end(self):
+        if self.tail is None:
+            return None
+        return self._unlink(self.tail)
+
+    def delete_by_value(self, value):
+        node = self._first_node_with(value)
+        if node is None:
+            return False
+        self._unlink(node)
+        return True
+
+class IndexedSinglyLinkedList(_PredecessorMapMixin, _ValueIndexMixin, SinglyLinkedList):
+    """SinglyLinkedList with a value index and a node -> predecessor map.
+
+    Knowing each node's predecessor makes delete_by_value and
+    delete_from_end O(1) on average.
+    """
+    def _unlink(self, node):
+        self._finger = None
+        prev_node = self._prev.pop(node)
+        next_node = node.next
+        if prev_node is None:
+            self.head = next_node
+        else:
+            prev_node.next = next_node
+        if next_node is None:
+            self.tail = prev_node
+        else:
+            self._prev[next_node] = prev_node
+        self.size -= 1
+        data = node.data
+        self._index_discard(node, data)
+        if self.pool is not None:
+            self.pool.release(node)
+        return data
+
+class IndexedDoublyLinkedList(_ValueIndexMixin, DoublyLinkedList):
+    """DoublyLinkedList with a value index; delete_by_value is O(1) on average"""
+    def _unlink(self, node):
+        self._finger = None
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        self.size -= 1
+        data = node.data
+        self._index_discard(node, data)
+        if self.pool is not None:
+            self.pool.release(node)
+        return data
+
+    def insert_at_beginning(self, data):
+        super().insert_at_beginning(data)
+        self._index_add(self.head)
+
+    def insert_at_end(self, data):
+        super().insert_at_end(data)
+        self._index_add(self.tail)
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == 0:
+            self.insert_at_beginning(data)
+            return True
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        current = self._node_at(index)
+        new_node = self.node_class(data)
+        new_node.prev = current.prev
+        new_node.next = current
+        current.prev.next = new_node
+        current.prev = new_node
+        self._finger = (index, new_node)
+        self._index_add(new_node)
+        self.size += 1
+        return True
+
+    def extend(self, iterable):
+        old_tail = self.tail
+        super().extend(iterable)
+        current = self.head if old_tail is None else old_tail.next
+        while current is not None:
+            self._index_add(current)
+            current = current.next
+
+    def extend_left(self, iterable):
+        old_head = self.head
+        super().extend_left(iterable)
+        current = self.head
+        while current is not old_head:
+            self._index_add(current)
+            current = current.next
+
+    def insert_after(self, node, data):
+        new_node = super().insert_after(node, data)
+        self._index_add(new_node)
+        return new_node
+
+    def remove_node(self, node):
+        return self._unlink(node)
+
+    def delete_from_beginning(self):
+        if self.head is None:
+            return None
+        return self._unlink(self.head)
+
+    def delete_from_end(self):
+        if self.tail is None:
+            return None
+        return self._unlink(self.tail)
+
+    def delete_by_value(self, value):
+        node = self._first_node_with(value)
+        if node is None:
+            return False
+        self._unlink(node)
+        return True
+
+class IndexedCircularLinkedList(_PredecessorMapMixin, _ValueIndexMixin, CircularLinkedList):
+    """CircularLinkedList with a value index and a node -> predecessor map.
+
+    The head's predecessor is stored as None and resolved to tail when the
+    head is unlinked; rotate() moves that None along with the head.
+    """
+    def _unlink(self, node):
+        self._finger = None
+        if self.head is self.tail:
+            self.head = self.tail = None
+            self._prev.clear()
+        else:
+            prev_node = self._prev.pop(node)
+            next_node = node.next
+            if prev_node is None:
+                prev_node = self.tail
+            prev_node.next = next_node
+            if node is self.head:
+                self.head = next_node
+                self._prev[next_node] = None
+            elif node is self.tail:
+                self.tail = prev_node
+            else:
+                self._prev[next_node] = prev_node
+        self.size -= 1
+        data = node.data
+        self._index_discard(node, data)
+        if self.pool is not None:
+            self.pool.release(node)
+        return data
+
+    def rotate(self, steps=1):
+        if self.head is None:
+            return
+        steps %= self.size
+        if steps:
+            self._finger = None
+        prev_map = self._prev
+        for i in range(steps):
+            # The head's predecessor is stored as None
+            prev_map[self.head] = self.tail
+            self.tail = self.head
+            self.head = self.head.next
+            prev_map[self.head] = None
+
+class SkipListNode:
+    """Skip list node with one forward link and span width per level"""
+    __slots__ = ('data', 'forward', 'width')
+
+    def __init__(self, data, level):
+        self.data = data
+        self.forward = [None] * level
+        self.width = [0] * level  # Level-0 steps covered by forward[i]
+
+class SkipList(_FlatSerializationMixin, _MemoryUsageMixin):
+    """Sorted linked list with express lanes for O(log n) expected search.
+
+    Each node is promoted to the next level with probability p, up to
+    max_level levels. Span widths on every link let search() report a
+    position and get() find an index in O(log n) as well. Equal values are
+    kept in insertion order.
+    """
+    node_class = SkipListNode
+
+    def __init__(self, max_level=16, p=0.5, seed=None):
+        if max_level < 1:
+            raise ValueError("max_level must be at least 1")
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+        self.max_level = max_level
+        self.p = p
+        self.level = 1
+        self.header = self.node_class(None, max_level)
+        self.size = 0
+        self._random = random.Random(seed).random
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """Build a skip list holding every value from iterable"""
+        skip_list = cls(**options)
+        skip_list.extend(iterable)
+        return skip_list
+
+    def _pickle_options(self):
+        return {"max_level": self.max_level, "p": self.p}
+
+    def __getstate__(self):
+        # Carry the RNG along so a copy promotes nodes like the original would
+        return self._random.__self__.getstate()
+
+    def __setstate__(self, state):
+        self._random.__self__.setstate(state)
+
+    def _storage_objects(self):
+        current = self.header
+        while current:
+            yield current
+            yield current.forward
+            yield current.width
+            current = current.forward[0]
+
+    def _random_level(self):
+        level = 1
+        while level < self.max_level and self._random() < self.p:
+            level += 1
+        return level
+
+    def insert(self, data):
+        update = [self.header] * self.max_level
+        rank = [0] * self.max_level
+        current = self.header
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while current.forward[i] is not None and current.forward[i].data <= data:
+                position += current.width[i]
+                current = current.forward[i]
+            update[i] = current
+            rank[i] = position
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                self.header.width[i] = self.size + 1
+            self.level = level
+        new_position = position + 1
+        new_node = self.node_class(data, level)
+        for i in range(level):
+            previous = update[i]
+            new_node.forward[i] = previous.forward[i]
+            previous.forward[i] = new_node
+            new_node.width[i] = previous.width[i] + rank[i] + 1 - new_position
+            previous.width[i] = new_position - rank[i]
+        for i in range(level, self.level):
+            update[i].width[i] += 1
+        self.size += 1
+
+    def extend(self, iterable):
+        for data in iterable:
+            self.insert(data)
+
+    def _remove(self, update, target):
+        for i in range(self.level):
+            if update[i].forward[i] is target:
+                update[i].width[i] += target.width[i] - 1
+                update[i].forward[i] = target.forward[i]
+            else:
+                update[i].width[i] -= 1
+        while self.level > 1 and self.header.forward[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return target.data
+
+    def delete_by_value(self, value):
+        """Remove the first occurrence of value; returns True if it was present"""
+        update = [self.header] * self.level
+        current = self.header
+        for i in range(self.level - 1, -1, -1):
+            while current.forward[i] is not None and current.forward[i].data < value:
+                current = current.forward[i]
+            update[i] = current
+        target = current.forward[0]
+        if target is None or target.data != value:
+            return False
+        self._remove(update, target)
+        return True
+
+    delete = delete_by_value
+
+    def delete_from_beginning(self):
+        """Remove and return the smallest value"""
+        target = self.header.forward[0]
+        if target is None:
+            return None
+        return self._remove([self.header] * self.level, target)
+
+    def delete_from_end(self):
+        """Remove and return the largest value"""
+        if self.size == 0:
+            return None
+        update = [self.header] * self.level
+        current = self.header
+        for i in range(self.level - 1, -1, -1):
+            # Stop in front of the last node (or the end of this level)
+            while current.forward[i] is not None and current.forward[i].forward[0] is not None:
+                current = current.forward[i]
+            update[i] = current
+        return self._remove(update, current.forward[0])
+
+    def search(self, value):
+        """Return the position of the first occurrence of value, or -1"""
+        current = self.header
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while current.forward[i] is not None and current.forward[i].data < value:
+                position += current.width[i]
+                current = current.forward[i]
+        target = current.forward[0]
+        if target is not None and target.data == value:
+            return position
+        return -1
+
+    def __contains__(self, value):
+        return self.search(value) != -1
+
+    def _node_at(self, index):
+        current = self.header
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while current.forward[i] is not None and position + current.width[i] <= index + 1:
+                position += current.width[i]
+                current = current.forward[i]
+        return current
+
+    def get(self, index):
+        """Return the value at index, or None if index is out of range"""
+        if index < 0 or index >= self.size:
+            return None
+        return self._node_at(index).data
+
+    def range_query(self, low, high):
+        """Yield the values v with low <= v <= high in sorted order"""
+        current = self.header
+        for i in range(self.level - 1, -1, -1):
+            while current.forward[i] is not None and current.forward[i].data < low:
+                current = current.forward[i]
+        current = current.forward[0]
+        while current is not None and current.data <= high:
+            yield current.data
+            current = current.forward[0]
+
+    def traverse(self):
+        return list(self)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.header.forward[0]
+        while current is not None:
+            yield current.data
+            current = current.forward[0]
+
+    def iter_range(self, start, stop=None):
+        """Yield the values at positions start <= i < stop"""
+        stop = self.size if stop is None else min(stop, self.size)
+        start = max(start, 0)
+        if start >= stop:
+            return
+        current = self._node_at(start)
+        for i in range(stop - start):
+            yield current.data
+            current = current.forward[0]
+
+    def tower_heights(self):
+        """Return the number of levels each node takes part in, in order"""
+        heights = []
+        current = self.header.forward[0]
+        while current is not None:
+            heights.append(len(current.forward))
+            current = current.forward[0]
+        return heights
+
+class UnrolledNode:
+    """Block of up to block_size values in an unrolled linked list"""
+    __slots__ = ('items', 'next', 'prev')
+
+    def __init__(self, items=None):
+        self.items = items if items is not None else []
+        self.next = None
+        self.prev = None
+
+class UnrolledLinkedList(_FlatSerializationMixin, _MemoryUsageMixin):
+    """Linked list of fixed-capacity blocks, each holding several values.
+
+    Fewer nodes mean fewer pointer hops and less per-element overhead;
+    positional lookups skip a whole block at a time. A full block is split
+    in half on insert, and a block that falls below half capacity after a
+    delete merges with (or borrows from) its successor; the tail block,
+    which has none, merges into its predecessor when they fit in one.
+    """
+    node_class = UnrolledNode
+
+    def __init__(self, block_size=16):
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.block_size = block_size
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """Build a list from any iterable, filling blocks to capacity"""
+        linked_list = cls(**options)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _pickle_options(self):
+        return {"block_size": self.block_size}
+
+    def _storage_objects(self):
+        block = self.head
+        while block:
+            yield block
+            yield block.items
+            block = block.next
+
+    def _link_block_after(self, block, new_block):
+        # Insert new_block after block (or at the front when block is None)
+        if block is None:
+            new_block.next = self.head
+            if self.head is not None:
+                self.head.prev = new_block
+            self.head = new_block
+        else:
+            new_block.prev = block
+            new_block.next = block.next
+            if block.next is not None:
+                block.next.prev = new_block
+            block.next = new_block
+        if new_block.next is None:
+            self.tail = new_block
+        return new_block
+
+    def _unlink_block(self, block):
+        if block.prev is None:
+            self.head = block.next
+        else:
+            block.prev.next = block.next
+        if block.next is None:
+            self.tail = block.prev
+        else:
+            block.next.prev = block.prev
+
+    def _locate(self, index):
+        # Return (block, offset) of index, skipping whole blocks from the nearer end
+        if index < self.size // 2:
+            block = self.head
+            while index >= len(block.items):
+                index -= len(block.items)
+                block = block.next
+            return block, index
+        block = self.tail
+        remaining = self.size - index
+        while remaining > len(block.items):
+            remaining -= len(block.items)
+            block = block.prev
+        return block, len(block.items) - remaining
+
+    def _rebalance(self, block):
+        if not block.items:
+            self._unlink_block(block)
+            return
+        if len(block.items) >= self.block_size // 2:
+            return
+        following = block.next
+        if following is None:
+            # The tail block has no successor; fold it into its predecessor
+            preceding = block.prev
+            if preceding is not None and len(preceding.items) + len(block.items) <= self.block_size:
+                preceding.items.extend(block.items)
+                self._unlink_block(block)
+            return
+        if len(block.items) + len(following.items) <= self.block_size:
+            block.items.extend(following.items)
+            self._unlink_block(following)
+        else:
+            borrow = (len(following.items) - len(block.items)) // 2
+            block.items.extend(following.items[:borrow])
+            del following.items[:borrow]
+
+    def _remove_at(self, block, offset):
+        data = block.items.pop(offset)
+        self.size -= 1
+        self._rebalance(block)
+        return data
+
+    def insert_at_beginning(self, data):
+        self.insert_at_index(data, 0)
+
+    def insert_at_end(self, data):
+        if self.tail is None or len(self.tail.items) >= self.block_size:
+            self._link_block_after(self.tail, self.node_class())
+        self.tail.items.append(data)
+        self.size += 1
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        block, offset = self._locate(index)
+        if len(block.items) >= self.block_size:
+            half = len(block.items) // 2
+            new_block = self._link_block_after(block, self.node_class(block.items[half:]))
+            del block.items[half:]
+            if offset > half:
+                block, offset = new_block, offset - half
+        block.items.insert(offset, data)
+        self.size += 1
+        return True
+
+    def extend(self, iterable):
+        """Append every value from iterable, in order"""
+        count = 0
+        for data in iterable:
+            if self.tail is None or len(self.tail.items) >= self.block_size:
+                self._link_block_after(self.tail, self.node_class())
+            self.tail.items.append(data)
+            count += 1
+        self.size += count
+
+    def extend_left(self, iterable):
+        """Prepend every value from iterable, keeping the iterable's order"""
+        values = list(iterable)
+        self.size += len(values)
+        if self.head is not None:
+            # Fill the head block's spare room with the last values first
+            spare = self.block_size - len(self.head.items)
+            if spare and values:
+                self.head.items[:0] = values[-spare:]
+                values = values[:-spare]
+        # Link full chunks back to front, so only the new head block can be short
+        for stop in range(len(values), 0, -self.block_size):
+            self._link_block_after(None, self.node_class(values[max(stop - self.block_size, 0):stop]))
+
+    def delete_from_beginning(self):
+        if self.head is None:
+            return None
+        return self._remove_at(self.head, 0)
+
+    def delete_from_end(self):
+        if self.tail is None:
+            return None
+        return self._remove_at(self.tail, len(self.tail.items) - 1)
+
+    def delete_by_value(self, value):
+        block = self.head
+        while block is not None:
+            try:
+                offset = block.items.index(value)
+            except ValueError:
+                block = block.next
+                continue
+            self._remove_at(block, offset)
+            return True
+        return False
+
+    def search(self, value):
+        block = self.head
+        position = 0
+        while block is not None:
+            try:
+                return position + block.items.index(value)
+            except ValueError:
+                position += len(block.items)
+                block = block.next
+        return -1
+
+    def get(self, index):
+        """Return the value at index, or None if index is out of range"""
+        if index < 0 or index >= self.size:
+            return None
+        block, offset = self._locate(index)
+        return block.items[offset]
+
+    def traverse(self):
+        elements = []
+        block = self.head
+        while block is not None:
+            elements.extend(block.items)
+            block = block.next
+        return elements
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        block = self.head
+        while block is not None:
+            yield from block.items
+            block = block.next
+
+    def __reversed__(self):
+        block = self.tail
+        while block is not None:
+            yield from reversed(block.items)
+            block = block.prev
+
+    def iter_range(self, start, stop=None):
+        """Yield the values at positions start <= i < stop without copying the list"""
+        stop = self.size if stop is None else min(stop, self.size)
+        start = max(start, 0)
+        if start >= stop:
+            return
+        block, offset = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = block.items[offset:offset + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            block, offset = block.next, 0
+
+    def block_count(self):
+        count = 0
+        block = self.head
+        while block is not None:
+            count += 1
+            block = block.next
+        return count
+
+class SelfOrganizingNode:
+    """Singly linked node with an access counter"""
+    __slots__ = ('data', 'next', 'count')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.count = 0
+
+class SelfOrganizingList(_FlatSerializationMixin, _MemoryUsageMixin):
+    """Singly linked list that reorders itself on every successful search.
+
+    Strategies:
+      - "move_to_front": the found node becomes the head
+      - "transpose": the found node swaps places with its predecessor
+      - "frequency_count": nodes stay ordered by access count, most used first
+
+    Search statistics are recorded so strategies can be compared on a
+    workload: depth is the number of nodes examined by a search.
+    """
+    node_class = SelfOrganizingNode
+
+    STRATEGIES = ("move_to_front", "transpose", "frequency_count")
+
+    def __init__(self, strategy="move_to_front"):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'. Choose from: {', '.join(self.STRATEGIES)}")
+        self.strategy = strategy
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.reset_stats()
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """Build a list holding every value from iterable, in order"""
+        linked_list = cls(**options)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _pickle_options(self):
+        return {"strategy": self.strategy}
+
+    def __getstate__(self):
+        counts = []
+        current = self.head
+        while current:
+            counts.append(current.count)
+            current = current.next
+        return {"counts": counts, "searches": self.searches, "hits": self.hits,
+                "total_depth": self.total_depth}
+
+    def __setstate__(self, state):
+        current = self.head
+        for count in state["counts"]:
+            current.count = count
+            current = current.next
+        self.searches = state["searches"]
+        self.hits = state["hits"]
+        self.total_depth = state["total_depth"]
+
+    def _storage_objects(self):
+        current = self.head
+        while current:
+            yield current
+            current = current.next
+
+    def reset_stats(self):
+        self.searches = 0
+        self.hits = 0
+        self.total_depth = 0
+
+    @property
+    def average_search_depth(self):
+        return self.total_depth / self.searches if self.searches else 0.0
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.searches if self.searches else 0.0
+
+    def insert_at_beginning(self, data):
+        new_node = self.node_class(data)
+        new_node.next = self.head
+        self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.size += 1
+
+    def insert_at_end(self, data):
+        new_node = self.node_class(data)
+        if self.tail is None:
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+        self.size += 1
+
+    def extend(self, iterable):
+        for data in iterable:
+            self.insert_at_end(data)
+
+    def _unlink(self, node, prev_node):
+        if prev_node is None:
+            self.head = node.next
+        else:
+            prev_node.next = node.next
+        if node is self.tail:
+            self.tail = prev_node
+
+    def _insert_after(self, node, prev_node):
+        if prev_node is None:
+            node.next = self.head
+            self.head = node
+        else:
+            node.next = prev_node.next
+            prev_node.next = node
+        if node.next is None:
+            self.tail = node
+
+    def delete_by_value(self, value):
+        prev_node = None
+        current = self.head
+        while current:
+            if current.data == value:
+                self._unlink(current, prev_node)
+                self.size -= 1
+                return True
+            prev_node, current = current, current.next
+        return False
+
+    def search(self, value):
+        """Return the position value was found at (before reordering), or -1"""
+        self.searches += 1
+        before_prev = prev_node = None
+        current = self.head
+        position = 0
+        while current:
+            if current.data == value:
+                break
+            before_prev, prev_node, current = prev_node, current, current.next
+            position += 1
+        else:
+            self.total_depth += self.size
+            return -1
+        self.hits += 1
+        self.total_depth += position + 1
+        current.count += 1
+        if prev_node is None:
+            return position
+        if self.strategy == "move_to_front":
+            self._unlink(current, prev_node)
+            self._insert_after(current, None)
+        elif self.strategy == "transpose":
+            self._unlink(current, prev_node)
+            self._insert_after(current, before_prev)
+        elif prev_node.count < current.count:
+            # Keep counts non-increasing: move ahead of every node with a lower count
+            self._unlink(current, prev_node)
+            target_prev = None
+            probe = self.head
+            while probe.count >= current.count:
+                target_prev, probe = probe, probe.next
+            self._insert_after(current, target_prev)
+        return position
+
+    def __contains__(self, value):
+        return self.search(value) != -1
+
+    def traverse(self):
+        return list(self)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+class XORLinkedList(_FlatSerializationMixin, _MemoryUsageMixin):
+    """Doubly linked list that stores a single prev XOR next link per slot.
+
+    Slots are indices into contiguous arrays; slot 0 is the shared NIL, so
+    link[i] == prev_slot ^ next_slot. Walking in either direction only needs
+    the slot we came from, which halves link storage compared with separate
+    prev/next arrays. Freed slots are chained through links and reused.
+    """
+    NIL = 0
+
+    def __init__(self):
+        self.values = [None]  # Slot 0 is the NIL sentinel
+        self.links = array('q', [0])
+        self.head = self.NIL
+        self.tail = self.NIL
+        self.free = self.NIL
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list from any iterable in a single linking pass"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _storage_objects(self):
+        return iter((self.values, self.links))
+
+    def _allocate(self, data):
+        if self.free != self.NIL:
+            slot = self.free
+            self.free = self.links[slot]
+            self.values[slot] = data
+        else:
+            slot = len(self.values)
+            self.values.append(data)
+            self.links.append(0)
+        return slot
+
+    def _release(self, slot):
+        data = self.values[slot]
+        self.values[slot] = None
+        self.links[slot] = self.free
+        self.free = slot
+        return data
+
+    def _walk_to(self, index):
+        # Return (prev_slot, slot) for position index, walking from the nearer end
+        links = self.links
+        if index < self.size // 2:
+            prev_slot, slot = self.NIL, self.head
+            for i in range(index):
+                prev_slot, slot = slot, links[slot] ^ prev_slot
+            return prev_slot, slot
+        next_slot, slot = self.NIL, self.tail
+        for i in range(self.size - 1 - index):
+            next_slot, slot = slot, links[slot] ^ next_slot
+        return links[slot] ^ next_slot, slot
+
+    def _unlink(self, prev_slot, slot):
+        links = self.links
+        next_slot = links[slot] ^ prev_slot
+        if prev_slot == self.NIL:
+            self.head = next_slot
+        else:
+            links[prev_slot] ^= slot ^ next_slot
+        if next_slot == self.NIL:
+            self.tail = prev_slot
+        else:
+            links[next_slot] ^= slot ^ prev_slot
+        self.size -= 1
+        return self._release(slot)
+
+    def insert_at_beginning(self, data):
+        slot = self._allocate(data)
+        self.links[slot] = self.head
+        if self.head == self.NIL:
+            self.tail = slot
+        else:
+            self.links[self.head] ^= slot
+        self.head = slot
+        self.size += 1
+
+    def insert_at_end(self, data):
+        slot = self._allocate(data)
+        self.links[slot] = self.tail
+        if self.tail == self.NIL:
+            self.head = slot
+        else:
+            self.links[self.tail] ^= slot
+        self.tail = slot
+        self.size += 1
+
+    def extend(self, iterable):
+        """Append every value from iterable, in order"""
+        for data in iterable:
+            self.insert_at_end(data)
+
+    def extend_left(self, iterable):
+        """Prepend every value from iterable, keeping the iterable's order"""
+        for data in reversed(list(iterable)):
+            self.insert_at_beginning(data)
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == 0:
+            self.insert_at_beginning(data)
+            return True
+        if index == self.size:
+            self.insert_at_end(data)
+            return True
+        prev_slot, current = self._walk_to(index)
+        slot = self._allocate(data)
+        links = self.links
+        links[slot] = prev_slot ^ current
+        links[prev_slot] ^= current ^ slot
+        links[current] ^= prev_slot ^ slot
+        self.size += 1
+        return True
+
+    def delete_from_beginning(self):
+        if self.head == self.NIL:
+            return None
+        return self._unlink(self.NIL, self.head)
+
+    def delete_from_end(self):
+        if self.tail == self.NIL:
+            return None
+        return self._unlink(self.links[self.tail], self.tail)
+
+    def delete_by_value(self, value):
+        values, links = self.values, self.links
+        prev_slot, slot = self.NIL, self.head
+        while slot != self.NIL:
+            if values[slot] == value:
+                self._unlink(prev_slot, slot)
+                return True
+            prev_slot, slot = slot, links[slot] ^ prev_slot
+        return False
+
+    def search(self, value):
+        values, links = self.values, self.links
+        prev_slot, slot = self.NIL, self.head
+        position = 0
+        while slot != self.NIL:
+            if values[slot] == value:
+                return position
+            prev_slot, slot = slot, links[slot] ^ prev_slot
+            position += 1
+        return -1
+
+    def get(self, index):
+        """Return the value at index, or None if index is out of range"""
+        if index < 0 or index >= self.size:
+            return None
+        return self.values[self._walk_to(index)[1]]
+
+    def traverse_forward(self):
+        return list(self)
+
+    traverse = traverse_forward
+
+    def traverse_backward(self):
+        return list(reversed(self))
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        values, links = self.values, self.links
+        prev_slot, slot = self.NIL, self.head
+        while slot != self.NIL:
+            yield values[slot]
+            prev_slot, slot = slot, links[slot] ^ prev_slot
+
+    def __reversed__(self):
+        values, links = self.values, self.links
+        next_slot, slot = self.NIL, self.tail
+        while slot != self.NIL:
+            yield values[slot]
+            next_slot, slot = slot, links[slot] ^ next_slot
@@ -13,6 +13,7 @@ import pandas as pd
 import time
 import random
 import math
+import itertools
 
 try:
     from quiz_config import QUIZ_QUESTIONS
@@ -160,10 +161,64 @@ if 'QUIZ_QUESTIONS' not in locals():
     ]
 
 try:
-    from linked_list_classes import Node, SinglyLinkedList, DoublyLinkedList, CircularLinkedList
+    from linked_list_classes import Node, SinglyLinkedList, DoublyLinkedList, CircularLinkedList, ArenaLinkedList, SkipList, payload_size
 except ImportError:
     st.error("⚠️ linked_list_classes.py not found. Please ensure all files are in the same directory.")
     st.stop()
+from persistent_lists import PersistentDeque
+from instrumentation import instrument
+
+# Upper bound on how many nodes are listed and drawn for the current list
+MAX_DISPLAYED_NODES = 50
+
+PLAYGROUND_LIST_CLASSES = {
+    "Singly Linked List": SinglyLinkedList,
+    "Doubly Linked List": DoublyLinkedList,
+    "Circular Linked List": CircularLinkedList,
+    "Arena Linked List": ArenaLinkedList,
+    "Skip List": SkipList,
+}
+
+
+def parse_playground_value(text, sample=None):
+    """Turn numeric input into int/float so sorted structures order it numerically.
+
+    If sample (an element already stored) is text, the input is kept as text.
+    """
+    if isinstance(sample, str):
+        return text
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def reset_playground_history():
+    """Start a fresh undo/redo history from the current playground list"""
+    st.session_state.list_version = PersistentDeque.from_iterable(st.session_state.linked_list)
+    st.session_state.undo_stack = []
+    st.session_state.redo_stack = []
+
+
+def record_playground_edit(new_version):
+    """Push the current version onto the undo stack and make new_version current.
+
+    Versions are persistent deques that share structure, so each edit only
+    costs the nodes it touched rather than a copy of the whole list.
+    """
+    st.session_state.undo_stack.append(st.session_state.list_version)
+    st.session_state.list_version = new_version
+    st.session_state.redo_stack.clear()
+
+
+def restore_playground_version(version):
+    """Rebuild the playground list from a stored version"""
+    st.session_state.list_version = version
+    list_class = PLAYGROUND_LIST_CLASSES[st.session_state.list_type]
+    st.session_state.linked_list = list_class.from_iterable(version)
+
 
 # Set page config
 st.set_page_config(
@@ -2478,7 +2533,7 @@ print(dll.traverse_backward())  # [3, 2, 1]
     Let's see how to calculate the sum of all elements in different linked list types.
     """)
     
-    tab1, tab2, tab3 = st.tabs(["Singly Linked", "Doubly Linked", "Circular Linked"])
+    tab1, tab2, tab3, tab4 = st.tabs(["Singly Linked", "Doubly Linked", "Circular Linked", "Typed Numeric (NumPy)"])
     
     with tab1:
         st.markdown("**Sum in Singly Linked List:**")
@@ -2574,6 +2629,23 @@ cll.insert_at_end(30)
 print(f"Sum: {calculate_sum_circular(cll.head)}")  # Output: 60
         """, language="python")
     
+    with tab4:
+        st.markdown("**Sum in a Typed Numeric List:**")
+        st.code("""
+# Values live in one typed NumPy array; links are index arrays,
+# so aggregates are a single vectorized call instead of a node walk
+from numeric_lists import NumericLinkedList
+
+nll = NumericLinkedList.from_iterable([10, 20, 30], dtype='int64')
+nll.insert_at_beginning(5)     # Linked-list style edits still work
+nll.delete_by_value(20)
+
+print(nll.sum())                # 45
+print(nll.max(), nll.argmax())  # 30 2
+print(nll.mean())               # 15.0
+doubled = nll.map(lambda values: values * 2)  # [10, 20, 60]
+        """, language="python")
+    
     # Interactive sum calculator
     st.subheader("🧮 Interactive Sum Calculator")
     
@@ -2614,6 +2686,7 @@ print(f"Sum: {calculate_sum_circular(cll.head)}")  # Output: 60
     | Singly Linked | O(n) | O(1) | Simple forward traversal |
     | Doubly Linked | O(n) | O(1) | Can traverse forward or backward |
     | Circular Linked | O(n) | O(1) | Must avoid infinite loops |
+    | Typed Numeric (NumPy) | O(n), vectorized | O(1) | One NumPy call; ~100x faster than walking nodes |
     """)
     
     st.info("💡 **Key Insight**: All linked list types have the same time complexity O(n) for sum calculation, but differ in implementation details.")
@@ -3220,13 +3293,25 @@ def interactive_playground():
     col1, col2 = st.columns([1, 1])
     with col1:
         if st.button("🎲 Random Data", key="random_data"):
-            if hasattr(st.session_state, 'linked_list') and st.session_state.linked_list:
+            if st.session_state.get('linked_list') is not None:
                 import random
                 random_values = [random.randint(1, 100) for _ in range(3)]
-                for val in random_values:
-                    st.session_state.linked_list.insert_at_end(val)
-                st.success(f"🎲 Added: {random_values}")
-                st.rerun()
+                try:
+                    st.session_state.linked_list.extend(random_values)
+                except TypeError:
+                    st.warning("This skip list holds text values; random numbers can't be ordered among them.")
+                else:
+                    version = st.session_state.list_version
+                    if st.session_state.list_type == "Skip List":
+                        # Mirror the sorted positions, smallest first so earlier positions are settled
+                        for val in sorted(random_values):
+                            version = version.insert(st.session_state.linked_list.search(val), val)
+                    else:
+                        for val in random_values:
+                            version = version.push_back(val)
+                    record_playground_edit(version)
+                    st.success(f"🎲 Added: {random_values}")
+                    st.rerun()
             else:
                 st.warning("Create a list first!")
     with col2:
@@ -3243,10 +3328,12 @@ def interactive_playground():
         st.session_state.list_type = "Singly Linked List"
     if 'linked_list' not in st.session_state:
         st.session_state.linked_list = SinglyLinkedList()
+    if 'list_version' not in st.session_state:
+        reset_playground_history()
 
     # List type selector
     st.header("Select Linked List Type")
-    list_types = ["Singly Linked List", "Doubly Linked List", "Circular Linked List"]
+    list_types = ["Singly Linked List", "Doubly Linked List", "Circular Linked List", "Arena Linked List", "Skip List"]
     selected_type = st.selectbox("Choose list type:", list_types, index=list_types.index(st.session_state.list_type))
 
     if selected_type != st.session_state.list_type:
@@ -3257,6 +3344,11 @@ def interactive_playground():
             st.session_state.linked_list = DoublyLinkedList()
         elif selected_type == "Circular Linked List":
             st.session_state.linked_list = CircularLinkedList()
+        elif selected_type == "Arena Linked List":
+            st.session_state.linked_list = ArenaLinkedList()
+        elif selected_type == "Skip List":
+            st.session_state.linked_list = SkipList()
+        reset_playground_history()
         st.rerun()
 
     st.header("Create Your Linked List")
@@ -3267,17 +3359,19 @@ def interactive_playground():
             if user_input:
                 values = [x.strip() for x in user_input.split(",") if x.strip()]
                 if st.session_state.list_type == "Singly Linked List":
-                    st.session_state.linked_list = SinglyLinkedList()
-                    for val in values:
-                        st.session_state.linked_list.insert_at_end(val)
+                    st.session_state.linked_list = SinglyLinkedList.from_iterable(values)
                 elif st.session_state.list_type == "Doubly Linked List":
-                    st.session_state.linked_list = DoublyLinkedList()
-                    for val in values:
-                        st.session_state.linked_list.insert_at_end(val)
+                    st.session_state.linked_list = DoublyLinkedList.from_iterable(values)
                 elif st.session_state.list_type == "Circular Linked List":
-                    st.session_state.linked_list = CircularLinkedList()
-                    for val in values:
-                        st.session_state.linked_list.insert_at_end(val)
+                    st.session_state.linked_list = CircularLinkedList.from_iterable(values)
+                elif st.session_state.list_type == "Arena Linked List":
+                    st.session_state.linked_list = ArenaLinkedList.from_iterable(values)
+                elif st.session_state.list_type == "Skip List":
+                    parsed = [parse_playground_value(val) for val in values]
+                    if not all(isinstance(val, (int, float)) for val in parsed):
+                        parsed = values  # Mixed input is ordered as text
+                    st.session_state.linked_list = SkipList.from_iterable(parsed)
+                record_playground_edit(PersistentDeque.from_iterable(st.session_state.linked_list))
                 st.success(f"{st.session_state.list_type} created with {len(values)} elements!")
             else:
                 st.warning("Please enter some values.")
@@ -3289,26 +3383,43 @@ def interactive_playground():
                 st.session_state.linked_list = DoublyLinkedList()
             elif st.session_state.list_type == "Circular Linked List":
                 st.session_state.linked_list = CircularLinkedList()
+            elif st.session_state.list_type == "Arena Linked List":
+                st.session_state.linked_list = ArenaLinkedList()
+            elif st.session_state.list_type == "Skip List":
+                st.session_state.linked_list = SkipList()
+            record_playground_edit(PersistentDeque())
             st.info(f"{st.session_state.list_type} cleared!")
 
+    # Undo/redo over persistent versions of the list
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        if st.button("↩️ Undo", key="undo_edit", disabled=not st.session_state.undo_stack):
+            st.session_state.redo_stack.append(st.session_state.list_version)
+            restore_playground_version(st.session_state.undo_stack.pop())
+            st.rerun()
+    with col2:
+        if st.button("↪️ Redo", key="redo_edit", disabled=not st.session_state.redo_stack):
+            st.session_state.undo_stack.append(st.session_state.list_version)
+            restore_playground_version(st.session_state.redo_stack.pop())
+            st.rerun()
+    with col3:
+        st.caption(f"History: {len(st.session_state.undo_stack)} undo / {len(st.session_state.redo_stack)} redo steps")
+
     st.header(f"Current {st.session_state.list_type}")
-    if st.session_state.linked_list.size > 0:
-        if st.session_state.list_type == "Doubly Linked List":
-            st.write("Forward: ", st.session_state.linked_list.traverse_forward())
-            st.write("Backward: ", st.session_state.linked_list.traverse_backward())
+    if len(st.session_state.linked_list) > 0:
+        # Stream only the window that is shown and plotted instead of copying the whole list
+        window = 20 if st.session_state.list_type == "Circular Linked List" else MAX_DISPLAYED_NODES
+        elements = list(st.session_state.linked_list.iter_range(0, window))
+        if st.session_state.list_type in ["Doubly Linked List", "Arena Linked List"]:
+            st.write("Forward: ", elements)
+            st.write("Backward: ", list(itertools.islice(reversed(st.session_state.linked_list), window)))
         else:
-            elements = st.session_state.linked_list.traverse() if st.session_state.list_type != "Circular Linked List" else st.session_state.linked_list.traverse(20)
             st.write("Elements: ", elements)
-        st.write(f"Length: {st.session_state.linked_list.size}")
-
-        # Enhanced Plotly visualization
-        elements = []
-        if st.session_state.list_type == "Doubly Linked List":
-            elements = st.session_state.linked_list.traverse_forward()
-        elif st.session_state.list_type == "Circular Linked List":
-            elements = st.session_state.linked_list.traverse(20)
-        else:
-            elements = st.session_state.linked_list.traverse()
+        st.write(f"Length: {len(st.session_state.linked_list)}")
+        if st.session_state.list_type == "Skip List":
+            st.write(f"Levels in use: {st.session_state.linked_list.level} of {st.session_state.linked_list.max_level}")
+        if len(st.session_state.linked_list) > len(elements):
+            st.caption(f"Showing the first {len(elements)} elements.")
 
         # Create interactive Plotly visualization
         fig = go.Figure()
@@ -3329,7 +3440,7 @@ def interactive_playground():
         ))
         
         # Add arrows based on list type
-        if st.session_state.list_type == "Doubly Linked List":
+        if st.session_state.list_type in ["Doubly Linked List", "Arena Linked List"]:
             # Forward arrows (next pointers)
             for i in range(len(elements) - 1):
                 fig.add_annotation(
@@ -3453,7 +3564,7 @@ def interactive_playground():
             yaxis=dict(showgrid=False, zeroline=False, showticklabels=False, 
                       range=[-1.5, 1] if st.session_state.list_type == "Circular Linked List" else [-0.8, 0.8]),
             showlegend=False,
-            height=400 if st.session_state.list_type in ["Circular Linked List", "Doubly Linked List"] else 300,
+            height=400 if st.session_state.list_type in ["Circular Linked List", "Doubly Linked List", "Arena Linked List"] else 300,
             margin=dict(l=20, r=20, t=40, b=20),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)'
@@ -3466,10 +3577,14 @@ def interactive_playground():
     st.header(f"Operations on {st.session_state.list_type}")
     if st.session_state.linked_list.size > 0:
         col1, col2, col3 = st.columns(3)
+        # Skip lists keep their own order and compare values, so input is parsed like the stored data
+        is_skip_list = st.session_state.list_type == "Skip List"
+        sample = st.session_state.linked_list.get(0) if is_skip_list else None
 
         with col1:
             st.subheader("Insert Element")
-            insert_pos = st.selectbox("Position", ["Beginning", "End", "At Index"])
+            insert_positions = ["Sorted Position"] if is_skip_list else ["Beginning", "End", "At Index"]
+            insert_pos = st.selectbox("Position", insert_positions)
             insert_val = st.text_input("Value to insert", key="insert_val")
 
             if insert_pos == "At Index":
@@ -3478,19 +3593,33 @@ def interactive_playground():
             if st.button("Insert", key="insert_btn"):
                 if insert_val:
                     success = False
-                    if insert_pos == "Beginning":
+                    if insert_pos == "Sorted Position":
+                        try:
+                            new_value = parse_playground_value(insert_val, sample)
+                            st.session_state.linked_list.insert(new_value)
+                            position = st.session_state.linked_list.search(new_value)
+                            record_playground_edit(st.session_state.list_version.insert(position, new_value))
+                            success = True
+                        except TypeError:
+                            st.warning("Skip list values must be comparable with the ones already stored.")
+                            success = None
+                    elif insert_pos == "Beginning":
                         st.session_state.linked_list.insert_at_beginning(insert_val)
+                        record_playground_edit(st.session_state.list_version.push_front(insert_val))
                         success = True
                     elif insert_pos == "End":
                         st.session_state.linked_list.insert_at_end(insert_val)
+                        record_playground_edit(st.session_state.list_version.push_back(insert_val))
                         success = True
                     else:  # At Index
                         success = st.session_state.linked_list.insert_at_index(insert_val, insert_idx)
+                        if success:
+                            record_playground_edit(st.session_state.list_version.insert(insert_idx, insert_val))
 
                     if success:
                         st.success(f"Inserted '{insert_val}' at {insert_pos.lower()}!")
                         st.rerun()
-                    else:
+                    elif success is False:
                         st.warning("Invalid index!")
                 else:
                     st.warning("Please enter a value to insert.")
@@ -3508,13 +3637,21 @@ def interactive_playground():
                     deleted = None
                     if delete_pos == "Beginning":
                         deleted = st.session_state.linked_list.delete_from_beginning()
+                        new_version = st.session_state.list_version.pop_front()[1]
                     elif delete_pos == "End":
                         deleted = st.session_state.linked_list.delete_from_end()
+                        new_version = st.session_state.list_version.pop_back()[1]
                     else:  # By Value
-                        if st.session_state.linked_list.delete_by_value(delete_val):
-                            deleted = delete_val
+                        target = parse_playground_value(delete_val, sample) if is_skip_list else delete_val
+                        try:
+                            if st.session_state.linked_list.delete_by_value(target):
+                                deleted = delete_val
+                        except TypeError:
+                            pass  # Not comparable with the stored values, so it can't be in the list
+                        new_version = st.session_state.list_version.remove(target)
 
                     if deleted is not None:
+                        record_playground_edit(new_version)
                         st.success(f"Removed '{deleted}' from {delete_pos.lower()}!")
                         st.rerun()
                     else:
@@ -3525,7 +3662,11 @@ def interactive_playground():
             search_val = st.text_input("Value to search", key="search_val")
 
             if st.button("Search", key="search_btn"):
-                idx = st.session_state.linked_list.search(search_val)
+                target = parse_playground_value(search_val, sample) if is_skip_list else search_val
+                try:
+                    idx = st.session_state.linked_list.search(target)
+                except TypeError:
+                    idx = -1  # Not comparable with the stored values, so it can't be in the list
                 if idx != -1:
                     st.success(f"Found '{search_val}' at index {idx}!")
                 else:
@@ -3563,7 +3704,7 @@ class Node:
         self.data = data
         self.next = None
 
-# Your current list: {st.session_state.linked_list.traverse() if hasattr(st.session_state.linked_list, 'traverse') else 'N/A'}
+# Your current list: {list(st.session_state.linked_list)}
 # Created on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}
         """
         
@@ -3774,9 +3915,9 @@ def performance_analysis():
     ]
 
     # Time complexities (1 = O(1), n = O(n))
-    singly_linked = [1, 'n', 'n', 1, 'n', 'n', 'n', 'n', 'n']
+    singly_linked = [1, 1, 'n', 1, 'n', 'n', 'n', 'n', 'n']  # Tail pointer makes insert at end O(1)
     doubly_linked = [1, 1, 'n', 1, 1, 'n', 'n', 'n', 'n']  # Assuming tail pointer for end operations
-    circular_singly = [1, 'n', 'n', 1, 'n', 'n', 'n', 'n', 'n']
+    circular_singly = [1, 1, 'n', 1, 'n', 'n', 'n', 'n', 'n']
     array_list = ['n', 1, 'n', 'n', 1, 'n', 'n', 'n', 1]
 
     # Create DataFrame for better display
@@ -3808,30 +3949,50 @@ def performance_analysis():
         default=['Insert at Beginning', 'Insert at End', 'Search by Value', 'Access by Index']
     )
 
+    col1, col2 = st.columns(2)
+    with col1:
+        list_size = st.select_slider("List size", options=[10, 100, 1_000, 10_000], value=1_000)
+    with col2:
+        work_metric = st.radio("Measure", ["Node dereferences", "Comparisons", "Allocations"], horizontal=True)
+
     if selected_operations:
-        # Prepare data for plotting
-        plot_data = []
-        structures = ['Singly Linked', 'Doubly Linked', 'Circular Linked', 'Dynamic Array']
+        # Run each operation once on a fresh list and count the work it actually does
+        middle = list_size // 2
+        operation_calls = {
+            'Insert at Beginning': lambda ll: ll.insert_at_beginning(-1),
+            'Insert at End': lambda ll: ll.insert_at_end(-1),
+            'Insert at Position': lambda ll: ll.insert_at_index(-1, middle),
+            'Delete from Beginning': lambda ll: ll.delete_from_beginning(),
+            'Delete from End': lambda ll: ll.delete_from_end(),
+            'Delete by Value': lambda ll: ll.delete_by_value(middle),
+            'Search by Value': lambda ll: ll.search(middle),
+            'Traversal': lambda ll: ll.traverse_forward() if isinstance(ll, DoublyLinkedList) else ll.traverse(),
+            'Access by Index': lambda ll: ll.get(middle)
+        }
+        counter = {'Node dereferences': 'dereferences', 'Comparisons': 'comparisons', 'Allocations': 'allocations'}[work_metric]
+        structures = {'Singly Linked': SinglyLinkedList, 'Doubly Linked': DoublyLinkedList, 'Circular Linked': CircularLinkedList}
 
+        plot_data = []
         for op in selected_operations:
-            idx = operations.index(op)
-            values = [
-                1 if singly_linked[idx] == 1 else 10,  # Convert to numeric for plotting
-                1 if doubly_linked[idx] == 1 else 10,
-                1 if circular_singly[idx] == 1 else 10,
-                1 if array_list[idx] == 1 else 10
-            ]
-            plot_data.append(go.Bar(name=op, x=structures, y=values))
+            values = []
+            for linked_list_class in structures.values():
+                linked_list = linked_list_class.from_iterable(range(list_size))
+                with instrument(linked_list) as stats:
+                    operation_calls[op](linked_list)
+                values.append(stats.last[1][counter])
+            plot_data.append(go.Bar(name=op, x=list(structures), y=values))
 
         fig = go.Figure(data=plot_data)
         fig.update_layout(
             barmode='group',
-            title="Time Complexity Comparison (Lower is Better)",
-            yaxis_title="Complexity (1 = O(1), 10 = O(n))",
+            title=f"{work_metric} per Operation on {list_size:,} Elements (Lower is Better)",
+            yaxis_title=f"{work_metric} (measured)",
             xaxis_title="Data Structure",
             height=500
         )
         st.plotly_chart(fig, use_container_width=True)
+        st.caption("Counted with instrumentation.instrument(); middle positions and values are used for "
+                   "positional and value-based operations.")
 
     st.header("Space Complexity Analysis")
 
@@ -4201,11 +4362,8 @@ def advanced_visualizations():
     st.markdown("</div>", unsafe_allow_html=True)
     
     # Get data based on selection or session state
-    if 'linked_list' in st.session_state and st.session_state.linked_list.size > 0:
-        if hasattr(st.session_state.linked_list, 'traverse_forward'):
-            elements = st.session_state.linked_list.traverse_forward()
-        else:
-            elements = st.session_state.linked_list.traverse()
+    if 'linked_list' in st.session_state and len(st.session_state.linked_list) > 0:
+        elements = list(st.session_state.linked_list.iter_range(0, MAX_DISPLAYED_NODES))
     else:
         elements = [10, 20, 30, 40, 50]
 
@@ -7326,40 +7484,48 @@ def performance_benchmarks():
     </div>
     ''', unsafe_allow_html=True)
 
-    st.markdown("")
-    memory_comparison_html = '''
-    <div style="background: rgba(0, 0, 0, 0.3); backdrop-filter: blur(10px); border-radius: 12px; padding: 1.5rem; margin: 1rem 0; border: 1px solid rgba(255, 255, 255, 0.1);">
-        <h4 style="color: var(--text-primary); margin: 0 0 1rem 0;">Memory Overhead Comparison</h4>
-        <table style="width: 100%; border-collapse: collapse; color: var(--text-primary);">
-            <thead>
-                <tr style="background: rgba(255, 255, 255, 0.1);">
-                    <th style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2); text-align: left;">Data Structure</th>
-                    <th style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2); text-align: left;">Element Size</th>
-                    <th style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2); text-align: left;">Overhead</th>
-                    <th style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2); text-align: left;">Total per Element</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2);">Linked List (Python)</td>
-                    <td style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2);">28 bytes</td>
-                    <td style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2);">8 bytes (pointer)</td>
-                    <td style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2);">~36 bytes</td>
-                </tr>
-                <tr style="background: rgba(255, 255, 255, 0.05);">
-                    <td style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2);">Dynamic Array (Python)</td>
-                    <td style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2);">28 bytes</td>
-                    <td style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2);">~4 bytes (amortized)</td>
-                    <td style="padding: 0.75rem; border: 1px solid rgba(255, 255, 255, 0.2);">~32 bytes</td>
-                </tr>
-            </tbody>
-        </table>
-        <div style="background: linear-gradient(135deg, rgba(255, 193, 7, 0.1), rgba(255, 193, 7, 0.05)); backdrop-filter: blur(10px); border-radius: 8px; padding: 0.75rem; margin-top: 1rem; border: 1px solid rgba(255, 193, 7, 0.3);">
-            <p style="color: var(--warning-orange); margin: 0; font-size: 0.9rem;">Note: Actual memory usage depends on the programming language and implementation.</p>
-        </div>
-    </div>
-    '''
-    st.markdown(memory_comparison_html, unsafe_allow_html=True)
+    from array import array as typed_array
+    from collections import deque
+
+    memory_sizes = st.multiselect(
+        "List sizes to measure",
+        [100, 1_000, 10_000, 100_000],
+        default=[1_000, 10_000],
+        key="memory_sizes"
+    )
+
+    memory_rows = []
+    for size in sorted(memory_sizes):
+        values = list(range(size))
+        for linked_list_class in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList):
+            usage = linked_list_class.from_iterable(values).memory_usage()
+            memory_rows.append({
+                'Size': size,
+                'Data Structure': linked_list_class.__name__,
+                'Nodes (B/elem)': usage['nodes'] / size,
+                'Payloads (B/elem)': usage['payloads'] / size,
+                'Container (B/elem)': usage['container'] / size,
+                'Total (B/elem)': usage['total'] / size
+            })
+        # Built-in containers keep their element storage inside the container object
+        for name, container in (("list", list(values)),
+                                ("collections.deque", deque(values)),
+                                ("array.array('q')", typed_array('q', values))):
+            container_bytes = sys.getsizeof(container)
+            payload_bytes = 0 if isinstance(container, typed_array) else payload_size(container)
+            memory_rows.append({
+                'Size': size,
+                'Data Structure': name,
+                'Nodes (B/elem)': 0.0,
+                'Payloads (B/elem)': payload_bytes / size,
+                'Container (B/elem)': container_bytes / size,
+                'Total (B/elem)': (container_bytes + payload_bytes) / size
+            })
+
+    if memory_rows:
+        st.dataframe(pd.DataFrame(memory_rows).round(1), use_container_width=True)
+        st.caption("Measured with memory_usage() and sys.getsizeof on this interpreter. "
+                   "array.array stores raw 8-byte integers, so it has no separate payload objects.")
 
 # Progress Tracking Feature
 def save_progress(section_name, data=None):
@@ -0,0 +1,244 @@
+# List Algorithms
+# Algorithms that work on raw node chains (anything with a .next pointer,
+# e.g. Node / SinglyNode from linked_list_classes.py). All cycle functions
+# use O(1) extra memory; merges relink nodes without recursion.
+
+import heapq
+from collections import namedtuple
+
+from linked_list_classes import SinglyNode, SinglyLinkedList, DoublyLinkedList, CircularLinkedList, _identity
+
+# start: first node on the cycle (None without a cycle); length: nodes on
+# the cycle (lambda); tail_length: nodes before the cycle (mu, 0 without a
+# cycle); detect_steps / steps: .next pointers followed to detect the
+# cycle / in total
+CycleInfo = namedtuple('CycleInfo', ['start', 'length', 'tail_length', 'detect_steps', 'steps'])
+
+NO_CYCLE = CycleInfo(None, 0, 0, 0, 0)
+
+
+def _floyd_meet(head):
+    # Return (node where slow and fast meet or None, pointers followed)
+    slow = fast = head
+    steps = 0
+    while fast is not None and fast.next is not None:
+        slow = slow.next
+        fast = fast.next.next
+        steps += 3
+        if slow is fast:
+            return slow, steps
+    return None, steps
+
+
+def _brent_length(head):
+    # Return (cycle length or 0, pointers followed)
+    if head is None:
+        return 0, 0
+    power = length = 1
+    tortoise = head
+    hare = head.next
+    steps = 1
+    while hare is not tortoise:
+        if hare is None:
+            return 0, steps
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = hare.next
+        steps += 1
+        length += 1
+    return length, steps
+
+
+def floyd_cycle(head):
+    """Find the cycle in a chain with Floyd's tortoise and hare.
+
+    After slow and fast meet, a pointer from head and one from the meeting
+    point reach the cycle start together; one more lap gives the length.
+    """
+    meet, detect_steps = _floyd_meet(head)
+    if meet is None:
+        return NO_CYCLE._replace(detect_steps=detect_steps, steps=detect_steps)
+    steps = detect_steps
+    start = head
+    tail_length = 0
+    while start is not meet:
+        start = start.next
+        meet = meet.next
+        steps += 2
+        tail_length += 1
+    length = 1
+    current = start.next
+    steps += 1
+    while current is not start:
+        current = current.next
+        steps += 1
+        length += 1
+    return CycleInfo(start, length, tail_length, detect_steps, steps)
+
+
+def brent_cycle(head):
+    """Find the cycle in a chain with Brent's power-of-two algorithm.
+
+    Detection yields the cycle length directly; two pointers that length
+    apart then meet at the cycle start.
+    """
+    length, detect_steps = _brent_length(head)
+    if not length:
+        return NO_CYCLE._replace(detect_steps=detect_steps, steps=detect_steps)
+    steps = detect_steps
+    hare = head
+    for i in range(length):
+        hare = hare.next
+    steps += length
+    start = head
+    tail_length = 0
+    while start is not hare:
+        start = start.next
+        hare = hare.next
+        steps += 2
+        tail_length += 1
+    return CycleInfo(start, length, tail_length, detect_steps, steps)
+
+
+def has_cycle(head, method="brent"):
+    """Return True if following .next from head never reaches None"""
+    if method == "floyd":
+        return _floyd_meet(head)[0] is not None
+    if method == "brent":
+        return _brent_length(head)[0] > 0
+    raise ValueError(f"Unknown method '{method}'. Choose 'floyd' or 'brent'")
+
+
+def find_cycle_start(head):
+    """Return the first node on the cycle, or None if the chain ends"""
+    return brent_cycle(head).start
+
+
+def cycle_length(head):
+    """Return the number of nodes on the cycle, or 0 if the chain ends"""
+    return _brent_length(head)[0]
+
+
+def _merge_two(left, left_last, right, right_last, key):
+    # Stable merge of two non-empty chains given with their last nodes; on
+    # equal keys left goes first. Returns (first, last)
+    dummy = last = SinglyNode(None)
+    left_key, right_key = key(left.data), key(right.data)
+    while True:
+        if right_key < left_key:
+            last.next = last = right
+            right = right.next
+            if right is None:
+                last.next = left
+                return dummy.next, left_last
+            right_key = key(right.data)
+        else:
+            last.next = last = left
+            left = left.next
+            if left is None:
+                last.next = right
+                return dummy.next, right_last
+            left_key = key(left.data)
+
+
+def _last_node(head):
+    last = head
+    while last.next is not None:
+        last = last.next
+    return last
+
+
+def _merge_heap(chains, key):
+    # chains: non-empty (first, last) pairs. The chain number breaks key
+    # ties, so equal keys keep the order of the input chains.
+    heap = [(key(first.data), number, first) for number, (first, last) in enumerate(chains)]
+    heapq.heapify(heap)
+    dummy = last = SinglyNode(None)
+    while len(heap) > 1:
+        data_key, number, node = heap[0]
+        last.next = last = node
+        node = node.next
+        if node is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (key(node.data), number, node))
+    # The last chain standing is already linked
+    last.next = heap[0][2]
+    return dummy.next, chains[heap[0][1]][1]
+
+
+def _merge_pairwise(chains, key):
+    # Merge neighbours round by round, so every node takes part in
+    # log2(k) merges and the merge stays stable
+    while len(chains) > 1:
+        merged = []
+        for i in range(0, len(chains) - 1, 2):
+            (left, left_last), (right, right_last) = chains[i], chains[i + 1]
+            merged.append(_merge_two(left, left_last, right, right_last, key))
+        if len(chains) % 2:
+            merged.append(chains[-1])
+        chains = merged
+    return chains[0]
+
+
+MERGE_STRATEGIES = {"heap": _merge_heap, "pairwise": _merge_pairwise}
+
+
+def merge_k_chains(heads, strategy="heap", key=None):
+    """Merge sorted None-terminated chains into one sorted chain; return its head.
+
+    The nodes are relinked, not copied, so the input chains are consumed.
+    strategy is "heap" (a heapq k-way merge, one heap operation per node)
+    or "pairwise" (divide and conquer, log2(k) rounds of two-way merges).
+    Both are stable: equal keys keep the order of the chains in heads.
+    Only next pointers are set; prev pointers of Node chains are left stale.
+    """
+    merge = MERGE_STRATEGIES.get(strategy)
+    if merge is None:
+        raise ValueError(f"Unknown strategy '{strategy}'. Choose from: {', '.join(MERGE_STRATEGIES)}")
+    chains = [(head, _last_node(head)) for head in heads if head is not None]
+    if not chains:
+        return None
+    return merge(chains, key or _identity)[0]
+
+
+def merge_k_lists(lists, strategy="heap", key=None):
+    """Merge sorted Singly, Doubly or Circular linked lists into a new list of the same class.
+
+    Nodes are moved, not copied: the input lists are left empty.
+    """
+    if not lists:
+        return SinglyLinkedList()
+    list_class = type(lists[0])
+    if list_class not in (SinglyLinkedList, DoublyLinkedList, CircularLinkedList):
+        raise TypeError(f"Cannot merge {list_class.__name__}; use merge_k_chains on its nodes")
+    if any(type(linked_list) is not list_class for linked_list in lists):
+        raise TypeError("All lists must be of the same class")
+    merge = MERGE_STRATEGIES.get(strategy)
+    if merge is None:
+        raise ValueError(f"Unknown strategy '{strategy}'. Choose from: {', '.join(MERGE_STRATEGIES)}")
+    chains = []
+    size = 0
+    for linked_list in lists:
+        if linked_list.head is not None:
+            linked_list.tail.next = None  # Opens a circular list
+            chains.append((linked_list.head, linked_list.tail))
+            size += linked_list.size
+        linked_list.head = linked_list.tail = None
+        linked_list.size = 0
+        linked_list._finger = None
+    result = list_class()
+    if not chains:
+        return result
+    result.head, result.tail = merge(chains, key or _identity)
+    result.size = size
+    if list_class is DoublyLinkedList:
+        prev_node, current = None, result.head
+        while current is not None:
+            current.prev = prev_node
+            prev_node, current = current, current.next
+    elif list_class is CircularLinkedList:
+        result.tail.next = result.head
+    return result
@@ -0,0 +1,286 @@
+# Numeric Linked Lists
+# A linked list of numbers kept in typed NumPy arrays, so aggregates such as
+# sum() or max() are a single vectorized call instead of a Python node walk.
+
+try:
+    import numpy as np
+except ImportError:  # Only this module needs numpy
+    np = None
+
+
+class NumericLinkedList:
+    """Doubly linked list of numbers stored in NumPy arrays of one dtype.
+
+    Slot i holds values[i] with links next[i] and prev[i] (NIL = -1), as in
+    ArenaLinkedList; deleted slots go on a free list. While the slots are
+    in increasing order along the links (lists built with extend() and
+    insert_at_end() and only trimmed at the ends), the live values in slot
+    order are the list in order, so aggregates, search() and argmax() need
+    no walk. Inserting at the front or in the middle breaks that order;
+    compact() restores it with one O(n) pass, and argmax()/search() call
+    it when needed.
+    """
+    NIL = -1
+
+    def __init__(self, dtype='float64', capacity=16):
+        if np is None:
+            raise ImportError("NumericLinkedList needs numpy (pip install numpy)")
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind not in 'biuf':
+            raise ValueError("dtype must be a boolean, integer or floating point type")
+        capacity = max(capacity, 1)
+        self.values = np.zeros(capacity, dtype=self.dtype)
+        self.next = np.full(capacity, self.NIL, dtype=np.int64)
+        self.prev = np.full(capacity, self.NIL, dtype=np.int64)
+        self.live = np.zeros(capacity, dtype=bool)
+        self.used = 0  # Slots [0, used) have been handed out at least once
+        self.head = self.NIL
+        self.tail = self.NIL
+        self.free = self.NIL
+        self.size = 0
+        self.ordered = True
+
+    @classmethod
+    def from_iterable(cls, iterable, dtype='float64'):
+        """Build a list from any iterable or array in one vectorized pass"""
+        linked_list = cls(dtype)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _grow(self, needed):
+        capacity = max(needed, 2 * len(self.values))
+        extra = capacity - len(self.values)
+        self.values = np.concatenate((self.values, np.zeros(extra, dtype=self.dtype)))
+        self.next = np.concatenate((self.next, np.full(extra, self.NIL, dtype=np.int64)))
+        self.prev = np.concatenate((self.prev, np.full(extra, self.NIL, dtype=np.int64)))
+        self.live = np.concatenate((self.live, np.zeros(extra, dtype=bool)))
+
+    def _allocate(self, data, fresh=False):
+        # fresh=True skips the free list so a new tail slot keeps slot order
+        if self.free != self.NIL and not fresh:
+            slot = self.free
+            self.free = int(self.next[slot])
+        else:
+            if self.used == len(self.values):
+                self._grow(self.used + 1)
+            slot = self.used
+            self.used += 1
+        self.values[slot] = data
+        self.live[slot] = True
+        return slot
+
+    def _release(self, slot):
+        self.live[slot] = False
+        self.size -= 1
+        if self.size == 0:
+            # Start over with dense, ordered slots
+            self.live[:self.used] = False
+            self.used = 0
+            self.head = self.tail = self.free = self.NIL
+            self.ordered = True
+            return
+        self.next[slot] = self.free
+        self.free = slot
+
+    def _link_after(self, prev_slot, slot):
+        # Link slot after prev_slot (at the front when prev_slot is NIL)
+        next_slot = self.head if prev_slot == self.NIL else int(self.next[prev_slot])
+        self.prev[slot] = prev_slot
+        self.next[slot] = next_slot
+        if prev_slot == self.NIL:
+            self.head = slot
+        else:
+            self.next[prev_slot] = slot
+        if next_slot == self.NIL:
+            self.tail = slot
+        else:
+            self.prev[next_slot] = slot
+        self.size += 1
+
+    def _unlink(self, slot):
+        prev_slot, next_slot = int(self.prev[slot]), int(self.next[slot])
+        if prev_slot == self.NIL:
+            self.head = next_slot
+        else:
+            self.next[prev_slot] = next_slot
+        if next_slot == self.NIL:
+            self.tail = prev_slot
+        else:
+            self.prev[next_slot] = prev_slot
+        data = self.values[slot].item()
+        self._release(slot)
+        return data
+
+    def _slot_at(self, index):
+        if self.ordered and self.size == self.used:
+            return index
+        if index < self.size // 2:
+            slot = self.head
+            for i in range(index):
+                slot = int(self.next[slot])
+        else:
+            slot = self.tail
+            for i in range(self.size - 1 - index):
+                slot = int(self.prev[slot])
+        return slot
+
+    def _live_values(self):
+        # Live values in slot order (a view when there are no holes)
+        if self.size == self.used:
+            return self.values[:self.used]
+        return self.values[:self.used][self.live[:self.used]]
+
+    def compact(self):
+        """Move the values into list order in slots 0..size-1 and drop the free list"""
+        if self.ordered and self.size == self.used:
+            return
+        if self.ordered:
+            order = np.flatnonzero(self.live[:self.used])
+        else:
+            next_links = self.next.tolist()
+            order = []
+            slot = self.head
+            while slot != self.NIL:
+                order.append(slot)
+                slot = next_links[slot]
+        size = self.size
+        self.values[:size] = self.values[order]
+        self.next[:size] = np.arange(1, size + 1)
+        self.prev[:size] = np.arange(-1, size - 1)
+        self.live[:self.used] = False
+        if size:
+            self.next[size - 1] = self.NIL
+            self.live[:size] = True
+            self.head, self.tail = 0, size - 1
+        self.used = size
+        self.free = self.NIL
+        self.ordered = True
+
+    def extend(self, iterable):
+        """Append every value from iterable, in order"""
+        if hasattr(iterable, '__len__'):
+            new_values = np.asarray(iterable, dtype=self.dtype)
+        else:
+            new_values = np.fromiter(iterable, dtype=self.dtype)
+        count = len(new_values)
+        if not count:
+            return
+        start, stop = self.used, self.used + count
+        if stop > len(self.values):
+            self._grow(stop)
+        self.values[start:stop] = new_values
+        self.live[start:stop] = True
+        self.next[start:stop - 1] = np.arange(start + 1, stop)
+        self.next[stop - 1] = self.NIL
+        self.prev[start + 1:stop] = np.arange(start, stop - 1)
+        self.prev[start] = self.tail
+        if self.tail == self.NIL:
+            self.head = start
+        else:
+            self.next[self.tail] = start
+        self.tail = stop - 1
+        self.used = stop
+        self.size += count
+
+    def insert_at_beginning(self, data):
+        if self.size:
+            self.ordered = False
+        self._link_after(self.NIL, self._allocate(data))
+
+    def insert_at_end(self, data):
+        self._link_after(self.tail, self._allocate(data, fresh=self.ordered))
+
+    def insert_at_index(self, data, index):
+        if index < 0 or index > self.size:
+            return False
+        if index == self.size:
+            self.insert_at_end(data)
+        elif index == 0:
+            self.insert_at_beginning(data)
+        else:
+            prev_slot = self._slot_at(index - 1)
+            self.ordered = False
+            self._link_after(prev_slot, self._allocate(data))
+        return True
+
+    def delete_from_beginning(self):
+        if self.head == self.NIL:
+            return None
+        return self._unlink(self.head)
+
+    def delete_from_end(self):
+        if self.tail == self.NIL:
+            return None
+        return self._unlink(self.tail)
+
+    def delete_by_value(self, value):
+        position = self.search(value)
+        if position == -1:
+            return False
+        self._unlink(position)  # search() compacted the list, so slot == position
+        return True
+
+    def search(self, value):
+        """Return the position of the first occurrence of value, or -1"""
+        self.compact()
+        hits = np.flatnonzero(self.values[:self.size] == value)
+        return int(hits[0]) if len(hits) else -1
+
+    def get(self, index):
+        """Return the value at index, or None if index is out of range"""
+        if index < 0 or index >= self.size:
+            return None
+        return self.values[self._slot_at(index)].item()
+
+    def sum(self):
+        return self._live_values().sum().item() if self.size else 0
+
+    def min(self):
+        if not self.size:
+            raise ValueError("min() of an empty list")
+        return self._live_values().min().item()
+
+    def max(self):
+        if not self.size:
+            raise ValueError("max() of an empty list")
+        return self._live_values().max().item()
+
+    def mean(self):
+        if not self.size:
+            raise ValueError("mean() of an empty list")
+        return self._live_values().mean().item()
+
+    def argmax(self):
+        """Return the position of the first largest value"""
+        if not self.size:
+            raise ValueError("argmax() of an empty list")
+        self.compact()
+        return int(self.values[:self.size].argmax())
+
+    def map(self, func):
+        """Return a new list of func applied to every value in one call.
+
+        func must work element-wise on an array (a ufunc or NumPy
+        expression such as `lambda values: values * 2`); the result's
+        dtype becomes the new list's dtype.
+        """
+        self.compact()
+        with np.errstate(all='ignore'):
+            mapped = np.asarray(func(self.values[:self.size]))
+        if mapped.shape != (self.size,):
+            raise ValueError("func must return one value per element")
+        return NumericLinkedList.from_iterable(mapped, dtype=mapped.dtype)
+
+    def to_numpy(self):
+        """Return the values in list order as a new array"""
+        self.compact()
+        return self.values[:self.size].copy()
+
+    def traverse(self):
+        return self.to_numpy().tolist()
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.traverse())
@@ -0,0 +1,168 @@
+# Persistent Linked Lists
+# Immutable lists that share structure between versions, so keeping every
+# version of a list (e.g. for undo/redo) costs memory per edit, not per copy.
+
+
+class PersistentList:
+    """Immutable cons list: each version shares its tail with older versions.
+
+    cons() is O(1) time and memory. insert()/delete() at index copy only the
+    index nodes in front of the change and share the rest.
+    """
+    __slots__ = ('first', 'rest', 'length')
+
+    def __init__(self, first, rest):
+        self.first = first
+        self.rest = rest
+        self.length = rest.length + 1
+
+    @classmethod
+    def empty(cls):
+        return _EMPTY_LIST
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        result = _EMPTY_LIST
+        for data in reversed(list(iterable)):
+            result = PersistentList(data, result)
+        return result
+
+    def cons(self, data):
+        """Return a new list with data in front of this one"""
+        return PersistentList(data, self)
+
+    def _rebuild(self, prefix, rest):
+        # Put the copied prefix values back in front of the shared remainder
+        for data in reversed(prefix):
+            rest = PersistentList(data, rest)
+        return rest
+
+    def _split(self, index):
+        # Return (values before index, node at index)
+        prefix = []
+        current = self
+        for i in range(index):
+            prefix.append(current.first)
+            current = current.rest
+        return prefix, current
+
+    def insert(self, index, data):
+        """Return a new list with data at index (clamped to the ends)"""
+        index = max(0, min(index, self.length))
+        prefix, rest = self._split(index)
+        return self._rebuild(prefix, PersistentList(data, rest))
+
+    def delete(self, index):
+        """Return a new list without the element at index (self if out of range)"""
+        if index < 0 or index >= self.length:
+            return self
+        prefix, rest = self._split(index)
+        return self._rebuild(prefix, rest.rest)
+
+    def index(self, value):
+        """Return the position of the first occurrence of value, or -1"""
+        position = 0
+        for data in self:
+            if data == value:
+                return position
+            position += 1
+        return -1
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        current = self
+        while current.length:
+            yield current.first
+            current = current.rest
+
+
+_EMPTY_LIST = object.__new__(PersistentList)
+_EMPTY_LIST.first = None
+_EMPTY_LIST.rest = None
+_EMPTY_LIST.length = 0
+
+
+class PersistentDeque:
+    """Immutable deque made of two persistent lists: front, and back reversed.
+
+    push_front/push_back are O(1) time and memory. Popping from an empty
+    side splits the other side in half first, which is O(n) but rare for
+    deque-like use.
+    """
+    __slots__ = ('front', 'back')
+
+    def __init__(self, front=None, back=None):
+        self.front = front if front is not None else _EMPTY_LIST
+        self.back = back if back is not None else _EMPTY_LIST
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls(PersistentList.from_iterable(iterable))
+
+    def push_front(self, data):
+        return PersistentDeque(self.front.cons(data), self.back)
+
+    def push_back(self, data):
+        return PersistentDeque(self.front, self.back.cons(data))
+
+    def _balanced(self):
+        # Split the values evenly between front and back
+        values = list(self)
+        middle = (len(values) + 1) // 2
+        return PersistentDeque(PersistentList.from_iterable(values[:middle]),
+                               PersistentList.from_iterable(reversed(values[middle:])))
+
+    def pop_front(self):
+        """Return (value, deque without it); value is None if the deque is empty"""
+        if not len(self):
+            return None, self
+        deque = self if self.front.length else self._balanced()
+        return deque.front.first, PersistentDeque(deque.front.rest, deque.back)
+
+    def pop_back(self):
+        """Return (value, deque without it); value is None if the deque is empty"""
+        if not len(self):
+            return None, self
+        deque = self if self.back.length else self._balanced()
+        if not deque.back.length:  # A single value lives in front
+            return deque.front.first, PersistentDeque()
+        return deque.back.first, PersistentDeque(deque.front, deque.back.rest)
+
+    def insert(self, index, data):
+        """Return a new deque with data at index (clamped to the ends)"""
+        if index <= self.front.length:
+            return PersistentDeque(self.front.insert(index, data), self.back)
+        back_index = len(self) - index
+        return PersistentDeque(self.front, self.back.insert(max(back_index, 0), data))
+
+    def delete(self, index):
+        """Return a new deque without the element at index (self if out of range)"""
+        if index < 0 or index >= len(self):
+            return self
+        if index < self.front.length:
+            return PersistentDeque(self.front.delete(index), self.back)
+        return PersistentDeque(self.front, self.back.delete(len(self) - 1 - index))
+
+    def index(self, value):
+        """Return the position of the first occurrence of value, or -1"""
+        position = 0
+        for data in self:
+            if data == value:
+                return position
+            position += 1
+        return -1
+
+    def remove(self, value):
+        """Return a new deque without the first occurrence of value (self if absent)"""
+        index = self.index(value)
+        return self if index == -1 else self.delete(index)
+
+    def __len__(self):
+        return self.front.length + self.back.length
+
+    def __iter__(self):
+        yield from self.front
+        if self.back.length:
+            yield from reversed(list(self.back))
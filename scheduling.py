@@ -0,0 +1,128 @@
+# Scheduling
+# Round-robin scheduling on a circular linked list: the task at the head
+# runs next, and rotating the list by one node moves it to the back.
+
+import time
+from collections import deque, namedtuple
+
+from linked_list_classes import IndexedCircularLinkedList
+
+# slices: time slices simulated; turns: dispatches made; seconds: wall
+# time; slice_counts: task -> slices it ran
+SimulationReport = namedtuple('SimulationReport', ['slices', 'turns', 'seconds', 'slice_counts'])
+
+
+class RoundRobinScheduler:
+    """Weighted round-robin over hashable tasks.
+
+    Each turn the head task gets weight * quantum consecutive time slices
+    and is rotated to the back. Tasks live in an IndexedCircularLinkedList,
+    so add, remove, skip and each dispatch are O(1) (remove on average).
+    """
+    def __init__(self, quantum=1):
+        if quantum < 1:
+            raise ValueError("quantum must be at least 1")
+        self.quantum = quantum
+        self.tasks = IndexedCircularLinkedList()
+        self.weights = {}
+        self.skips = {}  # task -> turns still to be passed over
+
+    def add(self, task, weight=1):
+        """Queue task at the back of the rotation"""
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        if task in self.weights:
+            raise ValueError(f"Task {task!r} is already scheduled")
+        self.tasks.insert_at_end(task)
+        self.weights[task] = weight
+
+    def remove(self, task):
+        """Take task out of the rotation; return False if it was not scheduled"""
+        if task not in self.weights:
+            return False
+        self.tasks.delete_by_value(task)
+        del self.weights[task]
+        self.skips.pop(task, None)
+        return True
+
+    def skip(self, task, turns=1):
+        """Pass over task for its next `turns` turns"""
+        if task not in self.weights:
+            return False
+        self.skips[task] = self.skips.get(task, 0) + turns
+        return True
+
+    def set_weight(self, task, weight):
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        if task not in self.weights:
+            return False
+        self.weights[task] = weight
+        return True
+
+    def dispatch(self):
+        """Return (task, slices) for the next turn, or None if nothing is scheduled"""
+        tasks = self.tasks
+        skips = self.skips
+        while tasks.head is not None:
+            task = tasks.head.data
+            tasks.rotate()
+            if skips:
+                remaining = skips.get(task)
+                if remaining:
+                    if remaining == 1:
+                        del skips[task]
+                    else:
+                        skips[task] = remaining - 1
+                    continue
+            return task, self.weights[task] * self.quantum
+        return None
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __contains__(self, task):
+        return task in self.weights
+
+    def __iter__(self):
+        # Tasks in the order they will be dispatched
+        return iter(self.tasks)
+
+
+def simulate(scheduler, slices):
+    """Run the scheduler for a number of time slices and report what ran"""
+    slice_counts = {}
+    remaining = slices
+    turns = 0
+    start = time.perf_counter()
+    while remaining > 0:
+        turn = scheduler.dispatch()
+        if turn is None:
+            break
+        task, quantum = turn
+        run = quantum if quantum < remaining else remaining
+        slice_counts[task] = slice_counts.get(task, 0) + run
+        remaining -= run
+        turns += 1
+    seconds = time.perf_counter() - start
+    return SimulationReport(slices - remaining, turns, seconds, slice_counts)
+
+
+def simulate_deque(weights, slices, quantum=1):
+    """Baseline: the same weighted round-robin on collections.deque.rotate"""
+    queue = deque(weights.items())
+    slice_counts = {}
+    remaining = slices
+    turns = 0
+    start = time.perf_counter()
+    while remaining > 0 and queue:
+        task, weight = queue[0]
+        queue.rotate(-1)
+        run = weight * quantum
+        if run > remaining:
+            run = remaining
+        slice_counts[task] = slice_counts.get(task, 0) + run
+        remaining -= run
+        turns += 1
+    seconds = time.perf_counter() - start
+    return SimulationReport(slices - remaining, turns, seconds, slice_counts)
@@ -0,0 +1,196 @@
+# Cache tests: random operations checked against an OrderedDict (LRU) or a
+# use-count table (LFU) model
+
+import random
+from collections import OrderedDict
+
+import pytest
+
+from caches import LRUCache, LFUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def drop_if_expired(model, key, now):
+    entry = model.get(key)
+    if entry is not None and entry[1] is not None and entry[1] <= now:
+        del model[key]
+        return True
+    return False
+
+
+@pytest.mark.parametrize("ttl", [None, 5.0])
+def test_lru_random_operations_match_ordered_dict(ttl):
+    for seed in range(100):
+        rng = random.Random(seed)
+        capacity = rng.randint(1, 8)
+        clock = FakeClock()
+        evicted = []
+        cache = LRUCache(capacity, ttl=ttl, clock=clock,
+                         on_evict=lambda key, value, reason: evicted.append((key, value, reason)))
+        model = OrderedDict()  # key -> (value, expires), least recently used first
+        expected_evicted = []
+        hits = misses = 0
+        for step in range(300):
+            key = rng.randint(0, 12)
+            operation = rng.random()
+            if operation < 0.1:
+                clock.now += rng.random() * 3
+            if operation < 0.5:
+                if drop_if_expired(model, key, clock.now):
+                    expected_evicted.append((key, "expired"))
+                if key in model:
+                    hits += 1
+                    assert cache.get(key, "missing") == model[key][0]
+                    model.move_to_end(key)
+                else:
+                    misses += 1
+                    assert cache.get(key, "missing") == "missing"
+            elif operation < 0.9:
+                entry_ttl = rng.choice([None, 1.0])
+                cache.put(key, step, ttl=entry_ttl)
+                lifetime = ttl if entry_ttl is None else entry_ttl
+                model.pop(key, None)
+                model[key] = (step, None if lifetime is None else clock.now + lifetime)
+                if len(model) > capacity:
+                    expected_evicted.append((model.popitem(last=False)[0], "capacity"))
+            else:
+                if drop_if_expired(model, key, clock.now):
+                    expected_evicted.append((key, "expired"))
+                assert cache.delete(key) == (key in model)
+                model.pop(key, None)
+            # Expired entries stay in the list until looked up; compare the live ones
+            assert [k for k in cache.keys() if k in model] == list(reversed(model))
+            assert [(key, reason) for key, value, reason in evicted] == expected_evicted
+        assert (cache.hits, cache.misses) == (hits, misses)
+        assert cache.evictions == sum(reason == "capacity" for key, reason in expected_evicted)
+
+
+def test_lru_byte_limit():
+    cache = LRUCache(capacity=None, max_bytes=1000, sizeof=len)
+    for key in range(10):
+        cache.put(key, "x" * 300)
+    assert cache.keys() == [9, 8, 7]
+    assert (cache.bytes, cache.evictions) == (900, 7)
+    cache.get(7)
+    cache.put("big", "x" * 700)  # Evicts the two least recently used entries
+    assert cache.keys() == ["big", 7]
+    assert cache.bytes == 1000
+    with pytest.raises(ValueError):
+        cache.put("huge", "x" * 1001)
+    cache.put(7, "x")  # Overwrites shrink the byte count
+    assert cache.bytes == 701
+
+
+def test_lru_ttl_and_purge():
+    clock = FakeClock()
+    cache = LRUCache(10, ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=1)
+    cache.put("c", 3, ttl=100)
+    clock.now = 5
+    assert "b" not in cache and cache.expirations == 1
+    assert cache.peek("a") == 1
+    clock.now = 10
+    assert cache.purge_expired() == 1
+    assert cache.keys() == ["c"]
+    with pytest.raises(KeyError):
+        cache["a"]
+
+
+def test_lru_rejects_bad_limits():
+    for options in [{"capacity": None}, {"capacity": 0}, {"max_bytes": 0}]:
+        with pytest.raises(ValueError):
+            LRUCache(**options)
+
+
+@pytest.mark.parametrize("tie_break", LFUCache.TIE_BREAKS)
+@pytest.mark.parametrize("aging", [False, True])
+def test_lfu_random_operations_match_counter(tie_break, aging):
+    for seed in range(100):
+        rng = random.Random(seed)
+        capacity = rng.randint(1, 6)
+        evicted = []
+        cache = LFUCache(capacity, tie_break=tie_break, aging=aging,
+                         on_evict=lambda key, value, reason: evicted.append(key))
+        model = {}  # key -> [value, count, time the key reached that count]
+        expected_evicted = []
+        age = 0
+        for time in range(400):
+            key = rng.randint(0, 10)
+            operation = rng.random()
+            if operation < 0.45:
+                if key in model:
+                    assert cache.get(key, "missing") == model[key][0]
+                    model[key][1:] = [model[key][1] + 1, time]
+                else:
+                    assert cache.get(key, "missing") == "missing"
+            elif operation < 0.9:
+                if key in model:
+                    model[key] = [time, model[key][1] + 1, time]
+                else:
+                    if len(model) >= capacity:
+                        if tie_break == "lru":
+                            victim = min(model, key=lambda k: (model[k][1], model[k][2]))
+                        else:
+                            victim = min(model, key=lambda k: (model[k][1], -model[k][2]))
+                        if aging:
+                            age = model[victim][1]
+                        del model[victim]
+                        expected_evicted.append(victim)
+                    model[key] = [time, age + 1, time]
+                cache.put(key, time)
+            else:
+                assert cache.delete(key) == (key in model)
+                model.pop(key, None)
+            assert evicted == expected_evicted
+            assert len(cache) == len(model)
+            for k, (value, count, reached) in model.items():
+                assert cache.frequency(k) == count
+                assert cache.peek(k) == value
+            counts = [bucket.count for bucket in cache.buckets]
+            assert counts == sorted(set(counts))  # Increasing, one bucket per count
+            assert all(len(bucket.keys) for bucket in cache.buckets)  # No empty buckets
+
+
+def test_lfu_promotes_and_evicts_least_frequent():
+    cache = LFUCache(3)
+    for key in "abc":
+        cache.put(key, key.upper())
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    assert [(bucket.count, list(bucket.keys)) for bucket in cache.buckets] == [(1, ["c"]), (2, ["b"]), (3, ["a"])]
+    cache.put("d", "D")  # Evicts c, the only key used once
+    assert "c" not in cache and cache.evictions == 1
+    cache.put("e", "E")  # d and nothing else at count 1
+    assert "d" not in cache
+    assert (cache.hits, cache.misses) == (3, 0)
+    assert cache.get("zzz") is None and cache.misses == 1
+
+
+def test_lfu_aging_lets_new_keys_displace_old_favourites():
+    plain, aged = LFUCache(2), LFUCache(2, aging=True)
+    for cache in (plain, aged):
+        cache.put("old", 0)
+        for i in range(5):
+            cache.get("old")
+        # A stream of new keys, each used twice
+        for key in range(10):
+            cache.put(key, key)
+            cache.get(key)
+    assert "old" in plain
+    assert "old" not in aged and aged.age > 0
+
+
+def test_lfu_rejects_bad_options():
+    with pytest.raises(ValueError):
+        LFUCache(0)
+    with pytest.raises(ValueError):
+        LFUCache(4, tie_break="random")
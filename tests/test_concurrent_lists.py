@@ -0,0 +1,129 @@
+# Thread-safe list tests: concurrent inserts and deletes must leave exactly the expected values
+
+import threading
+from collections import Counter
+
+import pytest
+
+from linked_list_classes import DoublyLinkedList
+from concurrent_lists import CoarseLockedList, HandOverHandList, RWLockList, ReadWriteLock
+
+THREADS = 8
+PER_THREAD = 150
+
+LISTS = {
+    "coarse": CoarseLockedList,
+    "coarse doubly": lambda: CoarseLockedList(DoublyLinkedList()),
+    "hand-over-hand": HandOverHandList,
+    "rw lock": RWLockList,
+}
+
+
+def run_threads(target, count=THREADS):
+    start = threading.Barrier(count)
+    errors = []
+
+    def worker(number):
+        start.wait()
+        try:
+            target(number)
+        except Exception as error:  # Re-raised in the main thread below
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+@pytest.mark.parametrize("make_list", LISTS.values(), ids=LISTS.keys())
+def test_concurrent_inserts_and_deletes(make_list):
+    linked_list = make_list()
+
+    def work(number):
+        # Each thread owns its values, so the survivors are known up front
+        values = [number * 10_000 + i for i in range(PER_THREAD)]
+        for i, value in enumerate(values):
+            if i % 3 == 0:
+                linked_list.insert_at_beginning(value)
+            elif i % 3 == 1:
+                linked_list.insert_at_end(value)
+            else:
+                assert linked_list.insert_at_index(value, 0)
+        for value in values[::2]:
+            assert linked_list.delete_by_value(value)
+        for value in values[1::2]:
+            assert linked_list.search(value) != -1
+
+    run_threads(work)
+    expected = Counter(number * 10_000 + i for number in range(THREADS) for i in range(1, PER_THREAD, 2))
+    assert len(linked_list) == sum(expected.values())
+    assert Counter(linked_list.traverse()) == expected
+
+
+@pytest.mark.parametrize("make_list", LISTS.values(), ids=LISTS.keys())
+def test_concurrent_deletes_from_both_ends(make_list):
+    linked_list = make_list()
+    for value in range(THREADS * PER_THREAD):
+        linked_list.insert_at_end(value)
+    taken = [[] for _ in range(THREADS)]
+
+    def work(number):
+        delete = linked_list.delete_from_beginning if number % 2 else linked_list.delete_from_end
+        for i in range(PER_THREAD // 2):
+            taken[number].append(delete())
+
+    run_threads(work)
+    removed = [value for values in taken for value in values]
+    assert None not in removed
+    assert len(set(removed)) == len(removed)  # No value was handed out twice
+    remaining = linked_list.traverse()
+    assert len(linked_list) == len(remaining) == THREADS * PER_THREAD - len(removed)
+    assert sorted(remaining + removed) == list(range(THREADS * PER_THREAD))
+    assert remaining == sorted(remaining)
+
+
+def test_rw_lock_excludes_writers():
+    lock = ReadWriteLock()
+    state = {"readers": 0, "writers": 0}
+    state_lock = threading.Lock()
+    violations = []
+
+    def enter(kind):
+        with state_lock:
+            state[kind] += 1
+            if state["writers"] > 1 or (state["writers"] and state["readers"]):
+                violations.append(dict(state))
+
+    def leave(kind):
+        with state_lock:
+            state[kind] -= 1
+
+    def work(number):
+        for i in range(300):
+            if (number + i) % 4 == 0:
+                with lock.write_locked():
+                    enter("writers")
+                    leave("writers")
+            else:
+                with lock.read_locked():
+                    enter("readers")
+                    leave("readers")
+
+    run_threads(work)
+    assert violations == []
+
+
+def test_rw_lock_readers_share():
+    lock = ReadWriteLock()
+    # Both readers must hold the lock at once to get through the barrier
+    inside = threading.Barrier(2, timeout=5)
+
+    def work(number):
+        with lock.read_locked():
+            inside.wait()
+
+    run_threads(work, count=2)
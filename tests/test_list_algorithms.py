@@ -0,0 +1,83 @@
+# Cycle detection tests on hand-built chains with known tail (mu) and cycle (lambda) lengths
+
+import pytest
+
+from linked_list_classes import SinglyNode
+from list_algorithms import (
+    NO_CYCLE, floyd_cycle, brent_cycle, has_cycle, find_cycle_start, cycle_length,
+)
+
+
+def build_rho(tail_length, length):
+    """Return (head, cycle start) of tail_length nodes leading into a cycle of length nodes"""
+    nodes = [SinglyNode(i) for i in range(tail_length + length)]
+    for node, following in zip(nodes, nodes[1:]):
+        node.next = following
+    if not nodes:
+        return None, None
+    if length:
+        nodes[-1].next = nodes[tail_length]
+        return nodes[0], nodes[tail_length]
+    return nodes[0], None
+
+
+GRID = [(tail_length, length) for tail_length in (0, 1, 2, 3, 7, 50) for length in (1, 2, 3, 5, 16, 101)]
+
+
+@pytest.mark.parametrize("algorithm", [floyd_cycle, brent_cycle])
+@pytest.mark.parametrize("tail_length, length", GRID)
+def test_finds_start_length_and_tail(algorithm, tail_length, length):
+    head, start = build_rho(tail_length, length)
+    info = algorithm(head)
+    assert info.start is start
+    assert info.length == length
+    assert info.tail_length == tail_length
+    assert 0 < info.detect_steps <= info.steps
+
+
+@pytest.mark.parametrize("tail_length, length", GRID)
+def test_helpers_on_cycles(tail_length, length):
+    head, start = build_rho(tail_length, length)
+    assert has_cycle(head, method="floyd")
+    assert has_cycle(head, method="brent")
+    assert find_cycle_start(head) is start
+    assert cycle_length(head) == length
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 10, 101])
+def test_acyclic_chains(size):
+    head, start = build_rho(size, 0)
+    for algorithm in (floyd_cycle, brent_cycle):
+        info = algorithm(head)
+        assert info.start is None
+        assert (info.length, info.tail_length) == (0, 0)
+        assert info.detect_steps == info.steps
+    assert not has_cycle(head, method="floyd")
+    assert not has_cycle(head, method="brent")
+    assert find_cycle_start(head) is None
+    assert cycle_length(head) == 0
+
+
+def test_empty_chain():
+    assert floyd_cycle(None) == NO_CYCLE
+    assert brent_cycle(None) == NO_CYCLE
+    assert not has_cycle(None)
+    assert find_cycle_start(None) is None
+    assert cycle_length(None) == 0
+
+
+def test_self_loop():
+    node = SinglyNode("loop")
+    node.next = node
+    for algorithm in (floyd_cycle, brent_cycle):
+        info = algorithm(node)
+        assert info.start is node
+        assert (info.length, info.tail_length) == (1, 0)
+    assert has_cycle(node, method="floyd") and has_cycle(node, method="brent")
+    assert find_cycle_start(node) is node
+    assert cycle_length(node) == 1
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        has_cycle(None, method="hare")
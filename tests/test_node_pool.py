@@ -0,0 +1,37 @@
+# NodePool tests: lists with an attached pool take exactly one node per value
+
+import pytest
+
+from linked_list_classes import (
+    SinglyNode, DoublyNode, NodePool,
+    SinglyLinkedList, DoublyLinkedList, CircularLinkedList,
+)
+
+LISTS = [(SinglyLinkedList, SinglyNode), (DoublyLinkedList, DoublyNode), (CircularLinkedList, SinglyNode)]
+
+
+@pytest.mark.parametrize("list_class, node_class", LISTS)
+def test_extend_acquires_one_node_per_value(list_class, node_class):
+    pool = NodePool(node_class)
+    linked_list = list_class()
+    linked_list.attach_pool(pool)
+    linked_list.extend(range(10))
+    assert pool.allocations + pool.reuses == 10
+    for i in range(4):
+        linked_list.delete_from_beginning()
+    assert len(pool) == 4
+    pool.reset_stats()
+    linked_list.extend(range(6))
+    assert (pool.reuses, pool.allocations) == (4, 2)
+    assert len(pool) == 0
+    assert list(linked_list) == [4, 5, 6, 7, 8, 9, 0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("list_class, node_class", LISTS)
+def test_extend_left_acquires_one_node_per_value(list_class, node_class):
+    pool = NodePool(node_class)
+    linked_list = list_class()
+    linked_list.attach_pool(pool)
+    linked_list.extend_left(range(5))
+    assert pool.allocations + pool.reuses == 5
+    assert list(linked_list) == [0, 1, 2, 3, 4]
@@ -0,0 +1,85 @@
+# SkipList tests: randomized operations checked against a sorted Python list
+
+import bisect
+import random
+
+import pytest
+
+from linked_list_classes import SkipList
+
+
+def check_matches(skip_list, expected):
+    assert skip_list.traverse() == expected
+    assert len(skip_list) == len(expected)
+    for index in range(-1, len(expected) + 1):
+        assert skip_list.get(index) == (expected[index] if 0 <= index < len(expected) else None)
+
+
+@pytest.mark.parametrize("max_level, p", [(1, 0.5), (4, 0.25), (16, 0.5), (16, 0.75)])
+def test_random_operations_match_sorted_list(max_level, p):
+    for seed in range(40):
+        rng = random.Random(seed)
+        skip_list = SkipList(max_level=max_level, p=p, seed=seed)
+        expected = []
+        for step in range(150):
+            operation = rng.randrange(6)
+            value = rng.randrange(15)  # Small range, so duplicates are common
+            if operation < 2:
+                skip_list.insert(value)
+                bisect.insort_right(expected, value)
+            elif operation == 2:
+                found = value in expected
+                assert skip_list.delete_by_value(value) == found
+                if found:
+                    expected.remove(value)
+            elif operation == 3:
+                assert skip_list.delete_from_beginning() == (expected.pop(0) if expected else None)
+            elif operation == 4:
+                assert skip_list.delete_from_end() == (expected.pop() if expected else None)
+            else:
+                assert skip_list.search(value) == (expected.index(value) if value in expected else -1)
+                assert (value in skip_list) == (value in expected)
+            check_matches(skip_list, expected)
+
+
+def test_duplicates_keep_insertion_order():
+    skip_list = SkipList(seed=1)
+    values = [(key % 3, order) for order, key in enumerate(range(30))]
+    for value in values:
+        skip_list.insert(value)
+    assert skip_list.traverse() == sorted(values)
+    skip_list = SkipList.from_iterable([2, 1, 2, 2, 1], seed=2)
+    assert skip_list.traverse() == [1, 1, 2, 2, 2]
+    assert skip_list.search(2) == 2
+    assert skip_list.delete_by_value(2)
+    assert skip_list.traverse() == [1, 1, 2, 2]
+
+
+def test_empty_list():
+    skip_list = SkipList(seed=0)
+    assert skip_list.delete_from_beginning() is None
+    assert skip_list.delete_from_end() is None
+    assert not skip_list.delete_by_value(1)
+    assert skip_list.search(1) == -1
+    assert skip_list.get(0) is None
+    assert list(skip_list.iter_range(0, 5)) == []
+    assert list(skip_list.range_query(0, 5)) == []
+
+
+def test_iter_range_and_range_query():
+    rng = random.Random(7)
+    values = sorted(rng.randrange(50) for _ in range(200))
+    skip_list = SkipList.from_iterable(values, seed=7)
+    for start in range(-2, len(values) + 3, 7):
+        for stop in (None, -1, 0, start, start + 1, start + 13, len(values) + 5):
+            end = len(values) if stop is None else stop
+            assert list(skip_list.iter_range(start, stop)) == values[max(start, 0):max(min(end, len(values)), 0)]
+    for low in range(-1, 52, 3):
+        for high in (low - 1, low, low + 4, 60):
+            assert list(skip_list.range_query(low, high)) == [v for v in values if low <= v <= high]
+
+
+@pytest.mark.parametrize("options", [{"max_level": 0}, {"max_level": -3}, {"p": 0}, {"p": 1}, {"p": -0.5}, {"p": 1.5}])
+def test_rejects_bad_options(options):
+    with pytest.raises(ValueError):
+        SkipList(**options)
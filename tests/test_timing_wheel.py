@@ -0,0 +1,101 @@
+# TimingWheel tests: random schedule/cancel/advance checked against a sorted list of deadlines
+
+import bisect
+import random
+
+import pytest
+
+from timing_wheel import TimingWheel, HeapTimerQueue
+
+# Small wheels wrap and cascade often; (3,) has a single wheel, so long delays park
+WHEEL_BITS = [(2, 2), (3,), (2, 1, 3), (8, 6, 6, 6)]
+
+
+def fired_deadlines(deadlines, now):
+    # Pop and return the (expires, number) pairs due by now, in order
+    due = bisect.bisect_right(deadlines, (now, float("inf")))
+    fired = deadlines[:due]
+    del deadlines[:due]
+    return fired
+
+
+@pytest.mark.parametrize("slot_bits", WHEEL_BITS)
+def test_random_operations_match_deadlines(slot_bits):
+    for seed in range(25):
+        rng = random.Random(seed)
+        wheel = TimingWheel(slot_bits)
+        deadlines = []  # Sorted (expires, number) of pending timers
+        timers = []
+        for step in range(400):
+            operation = rng.random()
+            if operation < 0.5:
+                delay = rng.choice([0, 1, 2, rng.randint(1, 20), rng.randint(1, 300), rng.randint(1, 5000)])
+                timer = wheel.schedule(delay)
+                assert timer.expires == wheel.now + max(delay, 1)
+                bisect.insort(deadlines, (timer.expires, len(timers)))
+                timers.append(timer)
+            elif operation < 0.7 and timers:
+                number = rng.randrange(len(timers))
+                key = (timers[number].expires, number)
+                position = bisect.bisect_left(deadlines, key)
+                pending = position < len(deadlines) and deadlines[position] == key
+                assert wheel.cancel(timers[number]) == pending
+                assert not timers[number].pending
+                if pending:
+                    del deadlines[position]
+            else:
+                fired = wheel.advance(rng.choice([1, 1, 3, 50, 700]))
+                expected = fired_deadlines(deadlines, wheel.now)
+                assert [timer.expires for timer in fired] == [expires for expires, number in expected]
+                assert {id(timer) for timer in fired} == {id(timers[number]) for expires, number in expected}
+                assert not any(timer.pending for timer in fired)
+            assert len(wheel) == len(deadlines)
+
+
+def test_cascade_across_every_level():
+    wheel = TimingWheel((2, 2, 2))
+    delays = [1, 3, 4, 5, 15, 16, 17, 63, 64, 65, 200]  # 64 ticks and up park in the top wheel
+    timers = [wheel.schedule(delay) for delay in delays]
+    seen = []
+    for tick in range(1, 201):
+        seen.extend((tick, timer.expires) for timer in wheel.advance())
+    assert seen == [(delay, delay) for delay in delays]
+    assert len(wheel) == 0 and not any(timer.pending for timer in timers)
+
+
+def test_callbacks_can_schedule_and_cancel():
+    wheel = TimingWheel((2, 2))
+    calls = []
+    doomed = wheel.schedule(10, lambda: calls.append("doomed"))
+
+    def first():
+        calls.append(("first", wheel.now))
+        wheel.cancel(doomed)
+        wheel.schedule(3, lambda: calls.append(("second", wheel.now)))
+
+    wheel.schedule(5, first)
+    wheel.advance(20)
+    assert calls == [("first", 5), ("second", 8)]
+
+
+def test_heap_queue_baseline_matches_wheel():
+    rng = random.Random(3)
+    wheel, heap_queue = TimingWheel((3, 3)), HeapTimerQueue()
+    pairs = []
+    for step in range(2000):
+        if rng.random() < 0.6:
+            delay = rng.randint(0, 400)
+            pairs.append((wheel.schedule(delay), heap_queue.schedule(delay)))
+        elif rng.random() < 0.5 and pairs:
+            timer, entry = rng.choice(pairs)
+            assert wheel.cancel(timer) == heap_queue.cancel(entry)
+        else:
+            ticks = rng.randint(1, 30)
+            assert sorted(t.expires for t in wheel.advance(ticks)) == [e[0] for e in heap_queue.advance(ticks)]
+        assert len(wheel) == len(heap_queue)
+
+
+def test_rejects_bad_slot_bits():
+    for slot_bits in [(), (0,), (3, 0)]:
+        with pytest.raises(ValueError):
+            TimingWheel(slot_bits)
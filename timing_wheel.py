@@ -0,0 +1,182 @@
+# Timing Wheel
+# A hashed, hierarchical timing wheel built from the library lists: each
+# wheel is a CircularLinkedList of slots whose head is the cursor, and each
+# slot holds a DoublyLinkedList chain of timers, so a timer can be
+# cancelled by unlinking its node.
+
+import heapq
+
+from linked_list_classes import CircularLinkedList, DoublyLinkedList
+
+
+class Timer:
+    """Handle returned by TimingWheel.schedule; pass it to cancel()"""
+    __slots__ = ('expires', 'callback', 'bucket', 'node')
+
+    def __init__(self, expires, callback):
+        self.expires = expires
+        self.callback = callback
+        self.bucket = None  # Slot chain holding the timer while it is pending
+        self.node = None
+
+    @property
+    def pending(self):
+        return self.bucket is not None
+
+    def __repr__(self):
+        return f"Timer(expires={self.expires}, pending={self.pending})"
+
+
+class TimingWheel:
+    """Hierarchical timing wheel with integer ticks.
+
+    Wheel 0 has 2**slot_bits[0] slots of one tick each; every slot of wheel
+    L covers one full turn of wheel L-1. A timer goes into the lowest wheel
+    whose range covers its delay, at the slot its expiry tick hashes to.
+    When a lower wheel wraps, the higher wheel's cursor moves one slot and
+    that slot's timers cascade down to finer wheels, so every timer moves
+    at most once per wheel. schedule() and cancel() are O(1); advance() is
+    amortised O(1) per tick plus O(levels) per timer. Delays beyond the
+    top wheel's range park in its furthest slot and are re-hashed each
+    time that slot comes round.
+    """
+    def __init__(self, slot_bits=(8, 6, 6, 6)):
+        if not slot_bits or min(slot_bits) < 1:
+            raise ValueError("slot_bits must be a non-empty sequence of positive bit counts")
+        self.now = 0
+        self.size = 0
+        self.shifts = []
+        self.masks = []
+        self.wheels = []
+        self.slots = []  # Slot chains of each wheel by index, for O(1) hashing
+        shift = 0
+        for bits in slot_bits:
+            wheel = CircularLinkedList.from_iterable(DoublyLinkedList() for i in range(1 << bits))
+            self.shifts.append(shift)
+            self.masks.append((1 << bits) - 1)
+            self.wheels.append(wheel)
+            self.slots.append(list(wheel))
+            shift += bits
+        self.limits = [1 << shift for shift in self.shifts[1:]] + [1 << shift]
+        self.span = 1 << shift  # Ticks covered by the top wheel
+
+    def _place(self, timer):
+        delay = timer.expires - self.now
+        expires = timer.expires
+        level = 0
+        for limit in self.limits:
+            if delay < limit:
+                break
+            level += 1
+        else:
+            level -= 1
+            expires = self.now + self.span - 1
+        bucket = self.slots[level][(expires >> self.shifts[level]) & self.masks[level]]
+        bucket.insert_at_end(timer)
+        timer.bucket = bucket
+        timer.node = bucket.tail
+
+    def schedule(self, delay, callback=None):
+        """Start a timer that expires `delay` ticks from now (at least 1)"""
+        timer = Timer(self.now + max(int(delay), 1), callback)
+        self._place(timer)
+        self.size += 1
+        return timer
+
+    def cancel(self, timer):
+        """Stop a pending timer in O(1); return False if it already fired or was cancelled"""
+        if timer.bucket is None:
+            return False
+        timer.bucket.remove_node(timer.node)
+        timer.bucket = timer.node = None
+        self.size -= 1
+        return True
+
+    def _cascade(self, level):
+        wheel = self.wheels[level]
+        wheel.rotate()
+        bucket = wheel.head.data
+        while bucket.head is not None:
+            timer = bucket.delete_from_beginning()
+            self._place(timer)
+
+    def advance(self, ticks=1):
+        """Move time forward, run the callbacks of expired timers and return them.
+
+        Timers come back in expiry order (within a tick, timers that
+        cascaded down follow those placed in wheel 0 directly). Callbacks
+        may schedule or cancel timers.
+        """
+        expired = []
+        wheel = self.wheels[0]
+        for i in range(ticks):
+            self.now += 1
+            wheel.rotate()
+            if not self.now & self.masks[0] and len(self.wheels) > 1:
+                # Wheel 0 wrapped: find the highest wheel that wrapped with
+                # it, then cascade from there down so timers flow inwards
+                level = 1
+                while level < len(self.wheels) - 1 and not (self.now >> self.shifts[level]) & self.masks[level]:
+                    level += 1
+                for cascade_level in range(level, 0, -1):
+                    self._cascade(cascade_level)
+            bucket = wheel.head.data
+            while bucket.head is not None:
+                timer = bucket.delete_from_beginning()
+                if timer.expires > self.now:
+                    # Parked beyond the range of a single wheel
+                    self._place(timer)
+                    continue
+                timer.bucket = timer.node = None
+                self.size -= 1
+                expired.append(timer)
+                if timer.callback is not None:
+                    timer.callback()
+        return expired
+
+    def __len__(self):
+        return self.size
+
+
+class HeapTimerQueue:
+    """Baseline: the same API on a heapq of [expires, sequence, callback] entries.
+
+    schedule() is O(log n); cancel() only marks the entry, which stays in
+    the heap until its expiry tick pops it.
+    """
+    def __init__(self):
+        self.now = 0
+        self.size = 0
+        self.heap = []
+        self.sequence = 0
+
+    def schedule(self, delay, callback=None):
+        entry = [self.now + max(int(delay), 1), self.sequence, callback, True]
+        self.sequence += 1
+        heapq.heappush(self.heap, entry)
+        self.size += 1
+        return entry
+
+    def cancel(self, entry):
+        if not entry[3]:
+            return False
+        entry[3] = False
+        self.size -= 1
+        return True
+
+    def advance(self, ticks=1):
+        expired = []
+        self.now += ticks
+        heap = self.heap
+        while heap and heap[0][0] <= self.now:
+            entry = heapq.heappop(heap)
+            if entry[3]:
+                entry[3] = False
+                self.size -= 1
+                expired.append(entry)
+                if entry[2] is not None:
+                    entry[2]()
+        return expired
+
+    def __len__(self):
+        return self.size